@@ -449,23 +449,24 @@ async def shutdown_event():
 # =============================================================================
 
 # Check if static files exist (built React app)
-static_dir = Path(__file__).parent.parent / "static"
-if static_dir.exists():
-    print(f"📦 Static files found at: {static_dir}")
-    print(f"📂 Contents: {list(static_dir.iterdir())}")
+# Resolved once as plain strings so per-request lookups skip Path construction
+STATIC_DIR = os.fspath(Path(__file__).parent.parent / "static")
+INDEX_PATH = os.path.join(STATIC_DIR, "index.html")
+if os.path.isdir(STATIC_DIR):
+    print(f"📦 Static files found at: {STATIC_DIR}")
+    print(f"📂 Contents: {os.listdir(STATIC_DIR)}")
 
     # Mount static assets (JS, CSS, images)
-    app.mount("/assets", StaticFiles(directory=str(static_dir / "assets")), name="assets")
+    app.mount("/assets", StaticFiles(directory=os.path.join(STATIC_DIR, "assets")), name="assets")
 
     # Serve index.html for root and all non-API routes
     @app.get("/")
     async def serve_root():
         """Serve React app at root"""
-        index_file = static_dir / "index.html"
-        if index_file.exists():
-            return FileResponse(index_file)
+        if os.path.isfile(INDEX_PATH):
+            return FileResponse(INDEX_PATH)
         else:
-            return {"error": "Frontend build not found", "path": str(index_file)}
+            return {"error": "Frontend build not found", "path": INDEX_PATH}
 
     @app.get("/{full_path:path}")
     async def serve_frontend(full_path: str):
@@ -475,18 +476,17 @@ if static_dir.exists():
             raise HTTPException(status_code=404, detail="API endpoint not found")
 
         # Check if requesting a static file
-        file_path = static_dir / full_path
-        if file_path.is_file():
+        file_path = os.path.join(STATIC_DIR, full_path)
+        if os.path.isfile(file_path):
             return FileResponse(file_path)
 
         # Otherwise serve index.html for SPA routing
-        index_file = static_dir / "index.html"
-        if index_file.exists():
-            return FileResponse(index_file)
+        if os.path.isfile(INDEX_PATH):
+            return FileResponse(INDEX_PATH)
         else:
             raise HTTPException(status_code=404, detail="Frontend not found")
 else:
-    print(f"⚠️  No static files found at: {static_dir}")
+    print(f"⚠️  No static files found at: {STATIC_DIR}")
     print(f"⚠️  React frontend will not be served!")
 
     @app.get("/")
@@ -500,4 +500,28 @@ else:
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+
+    # Development keeps the auto-reloader (single worker only); production
+    # runs one worker per core so a slow AI request can't block everyone.
+    # Multiple workers require the app as an import string, not an object.
+    dev_mode = os.getenv("ENVIRONMENT", "development").lower() == "development"
+    workers = 1 if dev_mode else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2))
+
+    # Optional TLS termination in production. uvicorn itself only speaks
+    # HTTP/1.1; for HTTP/2 multiplexing of SPA assets put a proxy
+    # (Caddy/nginx) in front and leave these unset.
+    ssl_options = {}
+    if not dev_mode and os.getenv("SSL_CERTFILE") and os.getenv("SSL_KEYFILE"):
+        ssl_options = {
+            "ssl_certfile": os.getenv("SSL_CERTFILE"),
+            "ssl_keyfile": os.getenv("SSL_KEYFILE")
+        }
+
+    uvicorn.run(
+        "backend.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=dev_mode,
+        workers=workers,
+        **ssl_options
+    )
@@ -2,8 +2,11 @@
 Prompt templates for AI interpretation of option-implied PDFs.
 """
 
-from typing import Dict, List, Optional
+import time
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+from functools import lru_cache
+from string import Formatter
 
 
 PDF_ANALYSIS_PROMPT = """You are a derivatives analyst interpreting option-implied probability densities for institutional clients.
@@ -127,68 +130,192 @@ Be honest and analytical.
 """
 
 
+def _compile_template(template: str, name: str) -> Callable[..., str]:
+    """
+    Compile a str.format template into a function built around one f-string.
+
+    The template is parsed once at import; the generated function takes the
+    template fields as keyword arguments, so calls skip the per-call parsing
+    and dict dispatch of str.format.
+
+    Args:
+        template: Template string using str.format syntax
+        name: Name given to the generated function
+
+    Returns:
+        Function producing the same output as template.format(**fields)
+    """
+    pieces = []
+    fields = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        pieces.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is None:
+            continue
+        if field not in fields:
+            fields.append(field)
+        pieces.append('{' + field)
+        if conversion:
+            pieces.append('!' + conversion)
+        if spec:
+            pieces.append(':' + spec)
+        pieces.append('}')
+
+    source = f"def {name}(*, {', '.join(fields)}):\n    return f{''.join(pieces)!r}\n"
+    namespace = {}
+    exec(compile(source, f"<prompt template {name}>", 'exec'), namespace)
+    return namespace[name]
+
+
+_format_pdf_analysis = _compile_template(PDF_ANALYSIS_PROMPT, '_format_pdf_analysis')
+_format_multi_expiration = _compile_template(MULTI_EXPIRATION_PROMPT, '_format_multi_expiration')
+_format_historical_comparison = _compile_template(HISTORICAL_COMPARISON_PROMPT, '_format_historical_comparison')
+_format_prediction_tracking = _compile_template(PREDICTION_TRACKING_PROMPT, '_format_prediction_tracking')
+
+
+# [date string, time it was computed]; refreshed at most once a minute
+_DATE_CACHE = [None, 0.0]
+
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD, re-formatting at most once a minute."""
+    now = time.time()
+    if _DATE_CACHE[0] is None or now - _DATE_CACHE[1] > 60:
+        _DATE_CACHE[0] = datetime.now().strftime('%Y-%m-%d')
+        _DATE_CACHE[1] = now
+    return _DATE_CACHE[0]
+
+
+def _freeze(values) -> tuple:
+    """Round floats to 4 decimals so jittered but identical prompts share a cache key."""
+    return tuple(round(float(v), 4) for v in values)
+
+
 def format_pdf_analysis_prompt(
     ticker: str,
     spot: float,
     stats: Dict[str, float],
     days_to_expiry: int,
-    historical_matches: Optional[List[Dict]] = None
+    historical_matches: Optional[List[Dict]] = None,
+    date: Optional[str] = None
 ) -> str:
     """
     Format the main PDF analysis prompt.
 
+    Results are memoized on the rounded inputs (see _format_pdf_analysis_cached).
+
     Args:
         ticker: Ticker symbol
         spot: Current spot price
         stats: PDF statistics dictionary
         days_to_expiry: Days to expiration
         historical_matches: Optional list of historical pattern matches
+        date: Analysis date (YYYY-MM-DD), defaults to today
 
     Returns:
         Formatted prompt string
     """
+    stat_values = _freeze((
+        stats['mean'],
+        stats.get('risk_neutral_drift_pct', 0),
+        stats['std'],
+        stats['implied_move_pct'],
+        stats['implied_volatility'],
+        stats['skewness'],
+        stats['excess_kurtosis'],
+        stats['prob_down_5pct'],
+        stats['prob_up_5pct'],
+        stats['prob_down_10pct'],
+        stats['prob_up_10pct'],
+        stats['ci_68_lower'],
+        stats['ci_68_upper'],
+        stats['ci_95_lower'],
+        stats['ci_95_upper']
+    ))
+
+    matches = tuple(
+        (
+            match['date'],
+            round(float(match['similarity']), 4),
+            match['description'],
+            match.get('actual_move', 'N/A'),
+            match.get('accuracy', 'N/A')
+        )
+        for match in (historical_matches or [])[:3]
+    )
+
+    return _format_pdf_analysis_cached(
+        ticker,
+        round(float(spot), 4),
+        date or _today_str(),
+        days_to_expiry,
+        stat_values,
+        matches
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_pdf_analysis_cached(
+    ticker: str,
+    spot: float,
+    date: str,
+    days_to_expiry: int,
+    stat_values: tuple,
+    matches: tuple
+) -> str:
+    """
+    Build the PDF analysis prompt from frozen, hashable inputs.
+
+    The analysis date is part of the key, so entries never outlive the day
+    they were built for; call _format_pdf_analysis_cached.cache_clear() to
+    drop them explicitly.
+    """
+    (mean, drift, std, implied_move, implied_vol, skew, kurtosis,
+     prob_down_5, prob_up_5, prob_down_10, prob_up_10,
+     ci_68_lower, ci_68_upper, ci_95_lower, ci_95_upper) = stat_values
+
     # Format historical context
     historical_context = ""
-    if historical_matches and len(historical_matches) > 0:
-        historical_context = "Historical Pattern Matches:\n"
-        for i, match in enumerate(historical_matches[:3], 1):
-            historical_context += f"{i}. {match['date']}: {match['similarity']:.0f}% similar - {match['description']}\n"
+    if matches:
+        historical_context = "Historical Pattern Matches:\n" + "".join([
+            f"{i}. {match_date}: {similarity:.0f}% similar - {description}\n"
+            for i, (match_date, similarity, description, _, _) in enumerate(matches, 1)
+        ])
     else:
         historical_context = "No significant historical pattern matches found."
 
     # Format historical comparison
     historical_comparison = ""
-    if historical_matches and len(historical_matches) > 0:
-        best_match = historical_matches[0]
-        historical_comparison = HISTORICAL_COMPARISON_PROMPT.format(
-            similarity=best_match['similarity'] * 100,
-            match_date=best_match['date'],
-            match_description=best_match.get('description', 'N/A'),
-            actual_move=best_match.get('actual_move', 'N/A'),
-            accuracy=best_match.get('accuracy', 'N/A')
+    if matches:
+        match_date, similarity, description, actual_move, accuracy = matches[0]
+        historical_comparison = _format_historical_comparison(
+            similarity=similarity * 100,
+            match_date=match_date,
+            match_description=description,
+            actual_move=actual_move,
+            accuracy=accuracy
         )
 
     # Format main prompt
-    return PDF_ANALYSIS_PROMPT.format(
+    return _format_pdf_analysis(
         ticker=ticker,
         spot=spot,
-        date=datetime.now().strftime('%Y-%m-%d'),
+        date=date,
         days_to_expiry=days_to_expiry,
-        mean=stats['mean'],
-        drift=stats.get('risk_neutral_drift_pct', 0),
-        std=stats['std'],
-        implied_move=stats['implied_move_pct'],
-        implied_vol=stats['implied_volatility'] * 100,
-        skew=stats['skewness'],
-        kurtosis=stats['excess_kurtosis'],
-        prob_down_5=stats['prob_down_5pct'] * 100,
-        prob_up_5=stats['prob_up_5pct'] * 100,
-        prob_down_10=stats['prob_down_10pct'] * 100,
-        prob_up_10=stats['prob_up_10pct'] * 100,
-        ci_68_lower=stats['ci_68_lower'],
-        ci_68_upper=stats['ci_68_upper'],
-        ci_95_lower=stats['ci_95_lower'],
-        ci_95_upper=stats['ci_95_upper'],
+        mean=mean,
+        drift=drift,
+        std=std,
+        implied_move=implied_move,
+        implied_vol=implied_vol * 100,
+        skew=skew,
+        kurtosis=kurtosis,
+        prob_down_5=prob_down_5 * 100,
+        prob_up_5=prob_up_5 * 100,
+        prob_down_10=prob_down_10 * 100,
+        prob_up_10=prob_up_10 * 100,
+        ci_68_lower=ci_68_lower,
+        ci_68_upper=ci_68_upper,
+        ci_95_lower=ci_95_lower,
+        ci_95_upper=ci_95_upper,
         historical_context=historical_context,
         historical_comparison=historical_comparison
     )
@@ -197,7 +324,8 @@ def format_pdf_analysis_prompt(
 def format_multi_expiration_prompt(
     ticker: str,
     spot: float,
-    expiration_data: List[Dict[str, any]]
+    expiration_data: List[Dict[str, any]],
+    date: Optional[str] = None
 ) -> str:
     """
     Format multi-expiration analysis prompt.
@@ -206,23 +334,20 @@ def format_multi_expiration_prompt(
         ticker: Ticker symbol
         spot: Current spot price
         expiration_data: List of dicts with stats for each expiration
+        date: Analysis date (YYYY-MM-DD), defaults to today
 
     Returns:
         Formatted prompt string
     """
     # Format expiration data table
-    exp_table = ""
-    vols = []
-    skews = []
-    for exp in expiration_data:
-        days = exp['days_to_expiry']
-        stats = exp['stats']
-        exp_table += f"  {days}D: IV={stats['implied_volatility']*100:.1f}%, "
-        exp_table += f"Skew={stats['skewness']:.2f}, "
-        exp_table += f"Move=±{stats['implied_move_pct']:.1f}%\n"
-
-        vols.append(stats['implied_volatility'] * 100)
-        skews.append(stats['skewness'])
+    exp_table = "".join([
+        f"  {exp['days_to_expiry']}D: IV={exp['stats']['implied_volatility']*100:.1f}%, "
+        f"Skew={exp['stats']['skewness']:.2f}, "
+        f"Move=±{exp['stats']['implied_move_pct']:.1f}%\n"
+        for exp in expiration_data
+    ])
+    vols = [exp['stats']['implied_volatility'] * 100 for exp in expiration_data]
+    skews = [exp['stats']['skewness'] for exp in expiration_data]
 
     # Analyze term structure patterns
     if len(vols) >= 2:
@@ -242,10 +367,10 @@ def format_multi_expiration_prompt(
     far_term_down = expiration_data[-1]['stats']['prob_down_5pct'] * 100
     tail_evolution = f"5% down risk: {near_term_down:.1f}% (near) → {far_term_down:.1f}% (far)"
 
-    return MULTI_EXPIRATION_PROMPT.format(
+    return _format_multi_expiration(
         ticker=ticker,
         spot=spot,
-        date=datetime.now().strftime('%Y-%m-%d'),
+        date=date or _today_str(),
         expiration_data=exp_table,
         vol_term_structure=vol_term_structure,
         skew_evolution=skew_evolution,
@@ -279,14 +404,13 @@ def format_prediction_tracking_prompt(
     Returns:
         Formatted prompt string
     """
-    accuracy = "Correct" if (
-        (condition == 'above' and final_price > target_level and predicted_prob > 0.5) or
-        (condition == 'below' and final_price < target_level and predicted_prob > 0.5) or
-        (condition == 'above' and final_price <= target_level and predicted_prob <= 0.5) or
-        (condition == 'below' and final_price >= target_level and predicted_prob <= 0.5)
-    ) else "Incorrect"
-
-    return PREDICTION_TRACKING_PROMPT.format(
+    # Correct when the forecast's confidence (>50%) agrees with whether the
+    # condition was hit
+    hit = final_price > target_level if condition == 'above' else final_price < target_level
+    confident = predicted_prob > 0.5
+    accuracy = "Correct" if condition in ('above', 'below') and hit == confident else "Incorrect"
+
+    return _format_prediction_tracking(
         forecast_date=forecast_date,
         predicted_prob=predicted_prob * 100,
         condition=f"Price {condition} ${target_level:.2f}",
@@ -8,17 +8,19 @@ strike gives the risk-neutral probability density function.
 Formula: f(K) = e^(rT) × ∂²C/∂K²
 """
 
+import math
 import numpy as np
-import pandas as pd
-from typing import Tuple, Optional, Dict
-from scipy import interpolate
+from typing import Tuple, Optional, Dict, List, TYPE_CHECKING
+from scipy.ndimage import convolve1d
+from scipy.signal import savgol_coeffs, savgol_filter
+from scipy.special import ndtr
 try:
-    from scipy.integrate import trapezoid, cumulative_trapezoid
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    # Fallback for older scipy versions
-    from scipy.integrate import trapz as trapezoid, cumtrapz as cumulative_trapezoid
+    # Numba is optional - the NumPy implementation is used instead
+    NUMBA_AVAILABLE = False
 
-from src.core.sabr import calibrate_volatility_surface
 from config.constants import (
     MIN_STRIKES_FOR_PDF,
     PDF_GRID_POINTS,
@@ -26,6 +28,66 @@ from config.constants import (
     MAX_STRIKE_PCT
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Loaded on first calibration: pulls in pysabr and scipy.optimize, which
+# code that only reads back a computed PDF never needs
+_calibrate_volatility_surface = None
+
+
+def _get_calibrate_volatility_surface():
+    """Import src.core.sabr.calibrate_volatility_surface on first use."""
+    global _calibrate_volatility_surface
+    if _calibrate_volatility_surface is None:
+        from src.core.sabr import calibrate_volatility_surface
+        _calibrate_volatility_surface = calibrate_volatility_surface
+    return _calibrate_volatility_surface
+
+
+# Savitzky-Golay smoothing of the raw density (window must be odd)
+SG_WINDOW_LENGTH = 51
+SG_POLYORDER = 3
+_SG_COEFFS = savgol_coeffs(SG_WINDOW_LENGTH, SG_POLYORDER)
+
+
+if NUMBA_AVAILABLE:
+    # Kernels are compiled eagerly for C-contiguous float64 arrays (the only
+    # layout calculate_from_options passes), so calls skip type dispatch and
+    # LLVM can assume unit stride. cache=True keeps the compile off later imports.
+    @njit('float64(float64)', fastmath=True, cache=True)
+    def _norm_cdf_nb(x):
+        """Standard normal CDF via erfc (scipy.stats is not callable from Numba)."""
+        return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+    @njit(
+        'float64[::1](float64[::1], float64, float64, float64, float64[::1], float64, float64, boolean)',
+        fastmath=True, cache=True
+    )
+    def _bs_price_nb(K, S, r, T, sigma, sqrt_T, discount, is_call):
+        """Black-Scholes call/put prices in a single loop over strikes."""
+        prices = np.empty(K.shape[0])
+        for i in range(K.shape[0]):
+            sigma_sqrt_T = sigma[i] * sqrt_T
+            d1 = (math.log(S / K[i]) + (r + 0.5 * sigma[i] * sigma[i]) * T) / sigma_sqrt_T
+            d2 = d1 - sigma_sqrt_T
+            if is_call:
+                prices[i] = S * _norm_cdf_nb(d1) - K[i] * discount * _norm_cdf_nb(d2)
+            else:
+                prices[i] = K[i] * discount * _norm_cdf_nb(-d2) - S * _norm_cdf_nb(-d1)
+        return prices
+
+    @njit('float64[::1](float64[::1], float64, float64)', fastmath=True, cache=True)
+    def _bl_density_nb(call_prices, dK, growth):
+        """e^(rT) * d2C/dK2 on a uniform grid, clamped at zero, in one pass."""
+        n = call_prices.shape[0]
+        pdf = np.empty(n)
+        scale = growth / (dK * dK)
+        for i in range(1, n - 1):
+            pdf[i] = max(scale * (call_prices[i + 1] - 2.0 * call_prices[i] + call_prices[i - 1]), 0.0)
+        pdf[0] = pdf[1]
+        pdf[n - 1] = pdf[n - 2]
+        return pdf
 
 class BreedenlitzenbergPDF:
     """
@@ -33,17 +95,29 @@ class BreedenlitzenbergPDF:
     the Breeden-Litzenberger formula.
     """
 
-    def __init__(self):
-        """Initialize PDF calculator."""
+    def __init__(self, dtype: np.dtype = np.float64):
+        """
+        Initialize PDF calculator.
+
+        Args:
+            dtype: Storage dtype for the resulting strikes/pdf/cdf arrays.
+                The calculation itself always runs in float64 (the second
+                difference loses too many digits in float32); pass np.float32
+                to halve the memory of stored results, e.g. when caching many
+                expirations.
+        """
+        self.dtype = np.dtype(dtype)
         self.pdf = None
         self.strikes = None
         self.cdf = None
         self.spot = None
         self.params = {}
+        self._x0 = None
+        self._dx = None
 
     def calculate_from_options(
         self,
-        options_df: pd.DataFrame,
+        options_df: 'pd.DataFrame',
         spot_price: float,
         risk_free_rate: float,
         time_to_expiry: float,
@@ -75,32 +149,14 @@ class BreedenlitzenbergPDF:
         min_strike = spot_price * MIN_STRIKE_PCT
         max_strike = spot_price * MAX_STRIKE_PCT
 
-        df = options_df[
-            (options_df['strike'] >= min_strike) &
-            (options_df['strike'] <= max_strike) &
-            (options_df['price'] > 0)
-        ].copy()
-
-        if len(df) < MIN_STRIKES_FOR_PDF:
-            raise ValueError(
-                f"Need at least {MIN_STRIKES_FOR_PDF} strikes, got {len(df)}"
-            )
-
-        # Sort by strike
-        df = df.sort_values('strike')
-
-        # Use mid price if available
-        if 'price' not in df.columns and 'bid' in df.columns and 'ask' in df.columns:
-            df['price'] = (df['bid'] + df['ask']) / 2
-
-        market_strikes = df['strike'].values
-        market_prices = df['price'].values
-        market_ivs = df['impliedVolatility'].values
+        market_strikes, market_prices, market_ivs = self._select_market_data(
+            options_df, min_strike, max_strike
+        )
 
         # Step 1: Interpolate volatility surface
         forward = spot_price * np.exp(risk_free_rate * time_to_expiry)
 
-        vol_model, vol_stats = calibrate_volatility_surface(
+        vol_model, vol_stats = _get_calibrate_volatility_surface()(
             market_strikes,
             market_ivs,
             forward,
@@ -115,13 +171,18 @@ class BreedenlitzenbergPDF:
         interp_ivs = vol_model.get_volatility(strike_grid)
 
         # Step 4: Calculate option prices on fine grid using Black-Scholes
+        # (sqrt(T) and the discount factor are shared by both pricers)
+        sqrt_T = np.sqrt(time_to_expiry)
+        discount = np.exp(-risk_free_rate * time_to_expiry)
         if option_type == 'call':
             interp_prices = self._black_scholes_call(
-                strike_grid, spot_price, risk_free_rate, time_to_expiry, interp_ivs
+                strike_grid, spot_price, risk_free_rate, time_to_expiry, interp_ivs,
+                sqrt_T=sqrt_T, discount=discount
             )
         else:
             interp_prices = self._black_scholes_put(
-                strike_grid, spot_price, risk_free_rate, time_to_expiry, interp_ivs
+                strike_grid, spot_price, risk_free_rate, time_to_expiry, interp_ivs,
+                sqrt_T=sqrt_T, discount=discount
             )
 
         # Step 5: Apply Breeden-Litzenberger formula
@@ -129,99 +190,232 @@ class BreedenlitzenbergPDF:
             strike_grid, interp_prices, risk_free_rate, time_to_expiry
         )
 
-        # Step 6: Normalize PDF (should integrate to 1)
-        pdf = self._normalize_pdf(strike_grid, pdf)
+        # Step 6: Normalize PDF (should integrate to 1) and calculate CDF
+        pdf, cdf = self._normalize_with_cdf(strike_grid, pdf)
 
-        # Store results
-        self.strikes = strike_grid
-        self.pdf = pdf
+        # Grid origin and spacing for closed-form CDF lookups (kept in float64)
+        self._x0 = float(strike_grid[0])
+        self._dx = float(strike_grid[1] - strike_grid[0])
 
-        # Calculate CDF
-        self.cdf = self._calculate_cdf(strike_grid, pdf)
+        # Store results
+        self.strikes = strike_grid.astype(self.dtype, copy=False)
+        self.pdf = pdf.astype(self.dtype, copy=False)
+        self.cdf = cdf.astype(self.dtype, copy=False)
 
-        return strike_grid, pdf
+        return self.strikes, self.pdf
 
-    def _breeden_litzenberger(
+    def calculate_batch(
         self,
-        strikes: np.ndarray,
-        call_prices: np.ndarray,
-        r: float,
-        T: float
-    ) -> np.ndarray:
+        expirations: List[Dict],
+        spot_price: float,
+        risk_free_rate: float,
+        option_type: str = 'call',
+        interpolation_method: str = 'sabr'
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Apply Breeden-Litzenberger formula: f(K) = e^(rT) × ∂²C/∂K²
+        Calculate PDFs for several expirations of the same underlying at once.
+
+        The strike grid depends only on spot, so every expiration shares it.
+        Volatility calibration still runs per expiration. Black-Scholes
+        pricing, the Breeden-Litzenberger stencil and normalization then run
+        once over an (N, PDF_GRID_POINTS) array.
 
         Args:
-            strikes: Strike prices
-            call_prices: Call option prices
-            r: Risk-free rate
-            T: Time to expiration
+            expirations: List of dicts with 'options_df' and 'time_to_expiry'
+            spot_price: Current spot price
+            risk_free_rate: Risk-free rate (as decimal)
+            option_type: 'call' or 'put'
+            interpolation_method: 'sabr' or 'spline'
 
         Returns:
-            Probability density values
+            Tuple of (strikes, pdfs, cdfs) where pdfs and cdfs have one row
+            per expiration, in input order
         """
-        # Calculate strike spacing
-        dK = np.gradient(strikes)
+        min_strike = spot_price * MIN_STRIKE_PCT
+        max_strike = spot_price * MAX_STRIKE_PCT
+        strike_grid = np.linspace(min_strike, max_strike, PDF_GRID_POINTS)
 
-        # First derivative: ∂C/∂K
-        dC_dK = np.gradient(call_prices, strikes)
+        Ts = np.array([exp['time_to_expiry'] for exp in expirations], dtype=np.float64)[:, None]
+        sigmas = np.empty((len(expirations), PDF_GRID_POINTS))
 
-        # Second derivative: ∂²C/∂K²
-        d2C_dK2 = np.gradient(dC_dK, strikes)
+        for row, exp in enumerate(expirations):
+            market_strikes, _, market_ivs = self._select_market_data(
+                exp['options_df'], min_strike, max_strike
+            )
+            forward = spot_price * np.exp(risk_free_rate * exp['time_to_expiry'])
+            vol_model, _ = _get_calibrate_volatility_surface()(
+                market_strikes,
+                market_ivs,
+                forward,
+                exp['time_to_expiry'],
+                method=interpolation_method
+            )
+            sigmas[row] = vol_model.get_volatility(strike_grid)
 
-        # Apply formula
-        pdf = np.exp(r * T) * d2C_dK2
+        # One broadcasted pricing pass over all expirations
+        sqrt_T = np.sqrt(Ts)
+        discount = np.exp(-risk_free_rate * Ts)
+        if option_type == 'call':
+            prices = self._black_scholes_call(
+                strike_grid, spot_price, risk_free_rate, Ts, sigmas,
+                sqrt_T=sqrt_T, discount=discount
+            )
+        else:
+            prices = self._black_scholes_put(
+                strike_grid, spot_price, risk_free_rate, Ts, sigmas,
+                sqrt_T=sqrt_T, discount=discount
+            )
 
-        # Ensure non-negative (numerical issues can cause small negative values)
-        pdf = np.maximum(pdf, 0)
+        pdfs = self._breeden_litzenberger(strike_grid, prices, risk_free_rate, Ts)
+        pdfs, cdfs = self._normalize_with_cdf(strike_grid, pdfs)
 
-        # Smooth out numerical noise
-        from scipy.signal import savgol_filter
-        try:
-            window_length = min(51, len(pdf) if len(pdf) % 2 == 1 else len(pdf) - 1)
-            if window_length >= 5:
-                pdf = savgol_filter(pdf, window_length=window_length, polyorder=3)
-                pdf = np.maximum(pdf, 0)  # Ensure still non-negative after smoothing
-        except:
-            pass  # Skip smoothing if it fails
+        return (
+            strike_grid.astype(self.dtype, copy=False),
+            pdfs.astype(self.dtype, copy=False),
+            cdfs.astype(self.dtype, copy=False)
+        )
 
-        return pdf
+    @staticmethod
+    def _select_market_data(
+        options_df: 'pd.DataFrame',
+        min_strike: float,
+        max_strike: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Filter quotes to the strike window and sort them by strike.
 
-    def _normalize_pdf(self, strikes: np.ndarray, pdf: np.ndarray) -> np.ndarray:
+        Args:
+            options_df: DataFrame with columns ['strike', 'impliedVolatility'] and
+                either 'price' or 'bid'/'ask' (mid price is used)
+            min_strike: Lowest strike to keep
+            max_strike: Highest strike to keep
+
+        Returns:
+            Tuple of (strikes, prices, implied_vols)
+        """
+        columns = set(options_df.columns)
+        missing = {'strike', 'impliedVolatility'} - columns
+        if missing:
+            raise ValueError(f"options_df is missing columns: {sorted(missing)}")
+
+        strikes_all = options_df['strike'].to_numpy(dtype=np.float64)
+        ivs_all = options_df['impliedVolatility'].to_numpy(dtype=np.float64)
+
+        # Use mid price if no price column is given
+        if 'price' in columns:
+            prices_all = options_df['price'].to_numpy(dtype=np.float64)
+        elif {'bid', 'ask'} <= columns:
+            prices_all = (
+                options_df['bid'].to_numpy(dtype=np.float64) +
+                options_df['ask'].to_numpy(dtype=np.float64)
+            ) / 2
+        else:
+            raise ValueError("options_df needs a 'price' column or 'bid' and 'ask' columns")
+
+        mask = (strikes_all >= min_strike) & (strikes_all <= max_strike) & (prices_all > 0)
+        n_strikes = int(np.count_nonzero(mask))
+
+        if n_strikes < MIN_STRIKES_FOR_PDF:
+            raise ValueError(
+                f"Need at least {MIN_STRIKES_FOR_PDF} strikes, got {n_strikes}"
+            )
+
+        # Sort by strike
+        market_strikes = strikes_all[mask]
+        order = np.argsort(market_strikes, kind='stable')
+        market_strikes = market_strikes[order]
+        market_prices = prices_all[mask][order]
+        market_ivs = ivs_all[mask][order]
+
+        return market_strikes, market_prices, market_ivs
+
+    def _breeden_litzenberger(
+        self,
+        strikes: np.ndarray,
+        call_prices: np.ndarray,
+        r: float,
+        T: float
+    ) -> np.ndarray:
         """
-        Normalize PDF so it integrates to 1.
+        Apply Breeden-Litzenberger formula: f(K) = e^(rT) × ∂²C/∂K²
 
         Args:
-            strikes: Strike prices
-            pdf: PDF values
+            strikes: Uniformly spaced strike prices
+            call_prices: Call option prices, shape (n,) or (N, n)
+            r: Risk-free rate
+            T: Time to expiration, scalar or shape (N, 1)
 
         Returns:
-            Normalized PDF
+            Probability density values, same shape as call_prices
         """
-        integral = trapezoid(pdf, strikes)
+        # The strike grid is uniform (np.linspace), so ∂²C/∂K² is the
+        # three-point stencil (C[i+1] - 2C[i] + C[i-1]) / dK² in one pass
+        dK = strikes[1] - strikes[0]
 
-        if integral <= 0:
-            raise ValueError("PDF integral is zero or negative - invalid PDF")
+        if NUMBA_AVAILABLE and call_prices.ndim == 1:
+            pdf = _bl_density_nb(
+                np.ascontiguousarray(call_prices, dtype=np.float64), dK, np.exp(r * T)
+            )
+        else:
+            # Second derivative: ∂²C/∂K² (edges copy their neighbours)
+            d2C_dK2 = np.empty_like(call_prices)
+            d2C_dK2[..., 1:-1] = (
+                call_prices[..., 2:] - 2 * call_prices[..., 1:-1] + call_prices[..., :-2]
+            ) / (dK * dK)
+            d2C_dK2[..., 0] = d2C_dK2[..., 1]
+            d2C_dK2[..., -1] = d2C_dK2[..., -2]
+
+            # Apply formula
+            pdf = np.exp(r * T) * d2C_dK2
+
+            # Ensure non-negative (numerical issues can cause small negative values)
+            pdf = np.maximum(pdf, 0)
+
+        # Smooth out numerical noise (along strikes)
+        n_points = pdf.shape[-1]
+        if n_points >= SG_WINDOW_LENGTH:
+            # Precomputed Savitzky-Golay kernel - no per-call least-squares fit
+            pdf = convolve1d(pdf, _SG_COEFFS, axis=-1, mode='nearest')
+            np.maximum(pdf, 0, out=pdf)  # Ensure still non-negative after smoothing
+        else:
+            window_length = n_points if n_points % 2 == 1 else n_points - 1
+            if window_length >= 5:
+                pdf = savgol_filter(pdf, window_length=window_length, polyorder=SG_POLYORDER, axis=-1)
+                pdf = np.maximum(pdf, 0)  # Ensure still non-negative after smoothing
 
-        return pdf / integral
+        return pdf
 
-    def _calculate_cdf(self, strikes: np.ndarray, pdf: np.ndarray) -> np.ndarray:
+    def _normalize_with_cdf(
+        self,
+        strikes: np.ndarray,
+        pdf: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculate cumulative distribution function.
+        Normalize PDF so it integrates to 1 and calculate its CDF.
+
+        A single cumulative trapezoid pass gives both: its last value is
+        the integral used for normalization. On the uniform grid the running
+        trapezoid sum is dK * (cumsum(pdf) - (pdf[0] + pdf) / 2), so no
+        pairwise-sum temporary is needed.
 
         Args:
-            strikes: Strike prices
-            pdf: PDF values
+            strikes: Uniformly spaced strike prices
+            pdf: PDF values, shape (n,) or (N, n)
 
         Returns:
-            CDF values
+            Tuple of (normalized PDF, CDF)
         """
-        cdf = cumulative_trapezoid(pdf, strikes, initial=0)
+        dK = strikes[1] - strikes[0]
 
-        # Ensure CDF ends at 1.0
-        cdf = cdf / cdf[-1] if cdf[-1] > 0 else cdf
+        cdf = np.cumsum(pdf, axis=-1)
+        cdf -= 0.5 * (pdf[..., :1] + pdf)
+        cdf *= dK
 
-        return cdf
+        integral = cdf[..., -1:]
+        if np.any(integral <= 0):
+            raise ValueError("PDF integral is zero or negative - invalid PDF")
+
+        return pdf / integral, cdf / integral
 
     def _black_scholes_call(
         self,
@@ -229,15 +423,23 @@ class BreedenlitzenbergPDF:
         S: float,
         r: float,
         T: float,
-        sigma: np.ndarray
+        sigma: np.ndarray,
+        sqrt_T: Optional[float] = None,
+        discount: Optional[float] = None
     ) -> np.ndarray:
         """Calculate Black-Scholes call price."""
-        from scipy.stats import norm
+        if discount is None:
+            discount = np.exp(-r * T)
+        if NUMBA_AVAILABLE and np.ndim(sigma) == 1 and np.ndim(T) == 0:
+            return _bs_price_nb(
+                np.ascontiguousarray(K, dtype=np.float64), S, r, T,
+                np.ascontiguousarray(sigma, dtype=np.float64),
+                np.sqrt(T) if sqrt_T is None else sqrt_T, discount, True
+            )
 
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        d1, d2 = self._bs_d1_d2(K, S, r, T, sigma, sqrt_T)
 
-        call_price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+        call_price = S * ndtr(d1) - K * discount * ndtr(d2)
 
         return call_price
 
@@ -247,18 +449,45 @@ class BreedenlitzenbergPDF:
         S: float,
         r: float,
         T: float,
-        sigma: np.ndarray
+        sigma: np.ndarray,
+        sqrt_T: Optional[float] = None,
+        discount: Optional[float] = None
     ) -> np.ndarray:
         """Calculate Black-Scholes put price."""
-        from scipy.stats import norm
+        if discount is None:
+            discount = np.exp(-r * T)
+        if NUMBA_AVAILABLE and np.ndim(sigma) == 1 and np.ndim(T) == 0:
+            return _bs_price_nb(
+                np.ascontiguousarray(K, dtype=np.float64), S, r, T,
+                np.ascontiguousarray(sigma, dtype=np.float64),
+                np.sqrt(T) if sqrt_T is None else sqrt_T, discount, False
+            )
 
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        d1, d2 = self._bs_d1_d2(K, S, r, T, sigma, sqrt_T)
 
-        put_price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+        put_price = K * discount * ndtr(-d2) - S * ndtr(-d1)
 
         return put_price
 
+    @staticmethod
+    def _bs_d1_d2(
+        K: np.ndarray,
+        S: float,
+        r: float,
+        T: float,
+        sigma: np.ndarray,
+        sqrt_T: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate Black-Scholes d1 and d2, computing sigma*sqrt(T) once."""
+        if sqrt_T is None:
+            sqrt_T = np.sqrt(T)
+        sigma_sqrt_T = sigma * sqrt_T
+
+        d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / sigma_sqrt_T
+        d2 = d1 - sigma_sqrt_T
+
+        return d1, d2
+
     def get_probability(self, strike_level: float, condition: str = 'below') -> float:
         """
         Get probability of spot being above/below a strike level.
@@ -274,11 +503,7 @@ class BreedenlitzenbergPDF:
             raise ValueError("PDF must be calculated first")
 
         # Interpolate CDF to get probability at exact strike
-        cdf_interp = interpolate.interp1d(
-            self.strikes, self.cdf, kind='linear', fill_value='extrapolate'
-        )
-
-        prob_below = float(cdf_interp(strike_level))
+        prob_below = float(self._cdf_at(strike_level))
 
         if condition == 'below':
             return prob_below
@@ -287,6 +512,39 @@ class BreedenlitzenbergPDF:
         else:
             raise ValueError("condition must be 'below' or 'above'")
 
+    def _cdf_at(self, strike_level):
+        """
+        Linearly interpolate the CDF on the uniform strike grid.
+
+        The grid index is computed directly from (x - x0) / dx instead of a
+        search. Levels outside the grid clamp to the end values of the CDF.
+
+        Args:
+            strike_level: Strike price or array of strike prices
+
+        Returns:
+            CDF value(s) at strike_level
+        """
+        if self._dx is None:
+            self._x0 = float(self.strikes[0])
+            self._dx = float(self.strikes[1] - self.strikes[0])
+
+        cdf = self.cdf
+        last = len(cdf) - 1
+
+        if np.ndim(strike_level) == 0:
+            u = (strike_level - self._x0) / self._dx
+            if u <= 0:
+                return cdf[0]
+            if u >= last:
+                return cdf[last]
+            i = int(u)
+            return cdf[i] + (u - i) * (cdf[i + 1] - cdf[i])
+
+        u = np.clip((np.asarray(strike_level, dtype=np.float64) - self._x0) / self._dx, 0, last)
+        i = np.minimum(u.astype(np.intp), last - 1)
+        return cdf[i] + (u - i) * (cdf[i + 1] - cdf[i])
+
     def get_probability_range(
         self,
         lower_strike: float,
@@ -309,7 +567,7 @@ class BreedenlitzenbergPDF:
 
 
 def calculate_pdf_from_options(
-    options_df: pd.DataFrame,
+    options_df: 'pd.DataFrame',
     spot_price: float,
     risk_free_rate: float,
     time_to_expiry: float,
@@ -335,6 +593,9 @@ def calculate_pdf_from_options(
 
 
 if __name__ == "__main__":
+    import pandas as pd
+    from scipy.integrate import trapezoid
+
     # Test with synthetic data
     print("Testing Breeden-Litzenberger PDF calculation...")
 
@@ -350,10 +611,9 @@ if __name__ == "__main__":
     ivs = atm_vol * (1 + 0.0005 * (strikes - spot)**2 / spot**2)
 
     # Calculate BS prices
-    from scipy.stats import norm
     d1 = (np.log(spot / strikes) + (r + 0.5 * ivs**2) * T) / (ivs * np.sqrt(T))
     d2 = d1 - ivs * np.sqrt(T)
-    call_prices = spot * norm.cdf(d1) - strikes * np.exp(-r * T) * norm.cdf(d2)
+    call_prices = spot * ndtr(d1) - strikes * np.exp(-r * T) * ndtr(d2)
 
     # Create DataFrame
     options_df = pd.DataFrame({
@@ -3,14 +3,173 @@ Historical pattern matching for option-implied PDFs.
 
 Find similar PDF shapes from historical data using cosine similarity
 and statistical feature matching.
+
+SimSIMD is used for the cosine kernel when installed. The historical
+corpus is kept in float32: shape scores only need ~1e-3 accuracy, and
+half-width data doubles the SIMD lanes of the matrix-vector product.
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
-from scipy.spatial.distance import cosine
 from scipy.stats import pearsonr
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    # SimSIMD is optional - a NumPy dot product is used instead
+    SIMSIMD_AVAILABLE = False
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - BLAS is used for every corpus size instead
+    NUMBA_AVAILABLE = False
+
 from config.constants import PATTERN_SIMILARITY_THRESHOLD, MAX_HISTORICAL_MATCHES
 
+# Number of points in the common grid used to compare PDF shapes
+SHAPE_GRID_POINTS = 100
+
+# Weights of the combined score (shape is more important than stats)
+SHAPE_WEIGHT = 0.7
+STATS_WEIGHT = 0.3
+
+# Statistical features compared by _stats_similarity and the scale of a
+# typical difference for each (implied move is in percentage points)
+STATS_FEATURES = ('skewness', 'excess_kurtosis', 'implied_move_pct')
+STATS_SCALES = np.array([1.0, 1.0, 5.0], dtype=np.float32)
+
+# Above this many candidate rows the shape scan is split across cores
+PARALLEL_SCAN_MIN_ROWS = 256
+
+
+if NUMBA_AVAILABLE:
+    @njit('void(float32[::1], float32[:, ::1], int64[::1], float32[::1])',
+          parallel=True, fastmath=True, cache=True)
+    def _dot_rows_nb(q, H, rows, out):
+        """out[i] = H[rows[i]] . q, one prange iteration per selected row."""
+        for i in prange(rows.shape[0]):
+            r = rows[i]
+            s = 0.0
+            for j in range(q.shape[0]):
+                s += q[j] * H[r, j]
+            out[i] = s
+
+
+def _cosine_distance(u: np.ndarray, v: np.ndarray) -> float:
+    """
+    Cosine distance between two non-zero vectors.
+
+    Uses SimSIMD's SIMD kernel on contiguous float32 data when available.
+
+    Args:
+        u, v: Vectors of equal length
+
+    Returns:
+        Cosine distance (0 for identical directions)
+    """
+    if SIMSIMD_AVAILABLE:
+        u32 = np.ascontiguousarray(u, dtype=np.float32)
+        v32 = np.ascontiguousarray(v, dtype=np.float32)
+        return float(simsimd.cosine(u32, v32))
+
+    return 1.0 - float(np.dot(u, v) / (np.linalg.norm(u) * np.linalg.norm(v)))
+
+
+def _interp_to_grid(grid: np.ndarray, strikes: np.ndarray, pdf: np.ndarray) -> np.ndarray:
+    """Interpolate a PDF onto grid; density is zero outside its strike range."""
+    return np.interp(grid, np.asarray(strikes, dtype=float), pdf, left=0.0, right=0.0)
+
+
+def _interp_rows_to_grid(grid: np.ndarray, strikes: np.ndarray, pdfs: np.ndarray) -> np.ndarray:
+    """
+    Interpolate several PDFs that share one strike grid in a single step.
+
+    Equivalent to _interp_to_grid on every row, but the bracketing indices
+    and weights are found once and applied to all rows by broadcasting.
+
+    Args:
+        grid: Target grid
+        strikes: Shared, increasing source strikes
+        pdfs: (n, len(strikes)) PDF values
+
+    Returns:
+        (n, len(grid)) interpolated PDFs
+    """
+    if strikes.size < 2 or np.any(np.diff(strikes) <= 0):
+        return np.array([_interp_to_grid(grid, strikes, pdf) for pdf in pdfs])
+
+    idx = np.clip(np.searchsorted(strikes, grid, side='right') - 1, 0, strikes.size - 2)
+    t = ((grid - strikes[idx]) / (strikes[idx + 1] - strikes[idx])).astype(pdfs.dtype)
+
+    out = pdfs[:, idx] * (1.0 - t) + pdfs[:, idx + 1] * t
+    out[:, (grid < strikes[0]) | (grid > strikes[-1])] = 0.0
+    return out
+
+
+def _stats_similarity_rows(stats_mat: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    Statistical similarity of every row of stats_mat to query.
+
+    Each feature difference maps to exp(-|diff| / scale); the score is the
+    mean over features present (non-NaN) in both, or 0.5 if there are none.
+
+    Args:
+        stats_mat: (N, len(STATS_FEATURES)) feature matrix
+        query: (1, len(STATS_FEATURES)) feature vector
+
+    Returns:
+        (N,) similarity scores (0-1)
+    """
+    sims = np.exp(-np.abs(stats_mat - query) / STATS_SCALES)
+
+    valid = ~np.isnan(sims)
+    count = valid.sum(axis=1)
+    total = np.where(valid, sims, 0.0).sum(axis=1)
+    return np.where(count > 0, total / np.maximum(count, 1), 0.5)
+
+
+def _l2_normalize(x: np.ndarray) -> np.ndarray:
+    """Scale vectors (rows of a matrix) to unit L2 norm, leaving zero rows as is."""
+    norms = np.linalg.norm(x, axis=-1, keepdims=True)
+    return x / np.where(norms > 0, norms, 1.0)
+
+
+_SKEW_DESCRIPTIONS = {
+    'left': "heavy left tail",
+    'right': "heavy right tail",
+    'sym': "symmetric",
+}
+
+_VOL_DESCRIPTIONS = {
+    'high': "high volatility",
+    'low': "low volatility",
+    'mod': "moderate volatility",
+}
+
+
+@lru_cache(maxsize=4096)
+def _describe_buckets(skew_bucket: str, vol_bucket: str, event: Optional[str]) -> str:
+    """
+    Description string for a (skew bucket, volatility bucket, event) triple.
+
+    Args:
+        skew_bucket: 'left', 'right' or 'sym'
+        vol_bucket: 'high', 'low' or 'mod'
+        event: Event label from the metadata, or None
+
+    Returns:
+        Description string
+    """
+    parts = [_SKEW_DESCRIPTIONS[skew_bucket], _VOL_DESCRIPTIONS[vol_bucket]]
+
+    # Add any custom metadata
+    if event is not None:
+        parts.append(f"({event})")
+
+    return ", ".join(parts)
+
 
 class PDFPatternMatcher:
     """
@@ -37,12 +196,107 @@ class PDFPatternMatcher:
         self.similarity_threshold = similarity_threshold
         self.max_matches = max_matches
 
+        # Historical corpus, built by precompute_historical
+        self._grid: Optional[np.ndarray] = None
+        self._H: Optional[np.ndarray] = None
+        self._dates: Optional[np.ndarray] = None
+        self._stats_dicts: List[Dict[str, float]] = []
+        self._stats_mat: Optional[np.ndarray] = None
+        self._metadata: List[Dict] = []
+
+    def precompute_historical(
+        self,
+        historical_data: List[Dict],
+        grid: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Build the historical corpus used by find_similar_patterns.
+
+        Every historical PDF is interpolated onto one common grid and
+        L2-normalized once, so the shape similarity against all entries
+        is a single matrix-vector product.
+
+        Args:
+            historical_data: List of historical PDF data dicts
+                (see find_similar_patterns for the keys)
+            grid: Common strike grid (defaults to SHAPE_GRID_POINTS points
+                spanning all historical strikes)
+        """
+        if grid is None:
+            grid = np.linspace(
+                min(np.min(h['strikes']) for h in historical_data),
+                max(np.max(h['strikes']) for h in historical_data),
+                SHAPE_GRID_POINTS
+            )
+
+        self._prepare_corpus(historical_data, grid)
+
+    def _prepare_corpus(self, historical_data: List[Dict], grid: np.ndarray) -> None:
+        """
+        Convert historical dicts to parallel arrays on a common grid.
+
+        Shapes go into one contiguous (N, len(grid)) matrix of L2-normalized
+        rows, statistics into an (N, len(STATS_FEATURES)) matrix, and dates,
+        stats dicts and metadata into parallel sequences used only to build
+        the returned matches.
+
+        Args:
+            historical_data: List of historical PDF data dicts
+            grid: Common strike grid
+        """
+        # Entries sharing a strike grid are interpolated together
+        groups = {}
+        for i, hist_data in enumerate(historical_data):
+            strikes = np.asarray(hist_data['strikes'], dtype=float)
+            groups.setdefault(strikes.tobytes(), (strikes, []))[1].append(i)
+
+        H = np.empty((len(historical_data), grid.size), dtype=np.float32)
+        for strikes, rows in groups.values():
+            pdfs = np.array([historical_data[i]['pdf'] for i in rows], dtype=np.float32)
+            H[rows] = _interp_rows_to_grid(grid, strikes, pdfs)
+        H = _l2_normalize(H)
+
+        self._grid = grid
+        self._H = H
+        self._dates = np.array([h['date'] for h in historical_data], dtype=object)
+        self._stats_dicts = [h['stats'] for h in historical_data]
+        self._stats_mat = self._stats_vectors(self._stats_dicts)
+        self._metadata = [h.get('metadata', {}) for h in historical_data]
+
+    @staticmethod
+    def _stats_vectors(stats_list: List[Dict[str, float]]) -> np.ndarray:
+        """
+        Stack statistics dicts into a (N, len(STATS_FEATURES)) matrix.
+
+        Args:
+            stats_list: Statistics dictionaries
+
+        Returns:
+            Feature matrix, NaN where a feature is missing
+        """
+        return np.array(
+            [[stats.get(f, np.nan) for f in STATS_FEATURES] for stats in stats_list],
+            dtype=np.float32
+        ).reshape(len(stats_list), len(STATS_FEATURES))
+
+    def _stats_similarity_batch(self, current_stats: Dict[str, float]) -> np.ndarray:
+        """
+        Vectorized _stats_similarity against every entry of the corpus.
+
+        Args:
+            current_stats: Current PDF statistics
+
+        Returns:
+            Array of similarity scores (0-1), one per historical entry
+        """
+        return _stats_similarity_rows(self._stats_mat, self._stats_vectors([current_stats]))
+
     def find_similar_patterns(
         self,
         current_pdf: np.ndarray,
         current_strikes: np.ndarray,
         current_stats: Dict[str, float],
-        historical_data: List[Dict]
+        historical_data: Optional[List[Dict]] = None
     ) -> List[Dict]:
         """
         Find historical PDFs similar to current PDF.
@@ -57,43 +311,75 @@ class PDFPatternMatcher:
                 - 'stats': Statistics dict
                 - 'date': Date string
                 - 'metadata': Optional additional info
+                If None, the corpus from precompute_historical is used.
 
         Returns:
             List of similar patterns, sorted by similarity (best first)
         """
-        if not historical_data:
+        current_strikes = np.asarray(current_strikes, dtype=float)
+
+        if historical_data is not None:
+            if not historical_data:
+                return []
+            # One canonical grid spanning the current strikes for all pairs
+            grid = np.linspace(current_strikes.min(), current_strikes.max(), SHAPE_GRID_POINTS)
+            self._prepare_corpus(historical_data, grid)
+        elif self._H is None:
             return []
 
-        matches = []
+        # The current PDF is interpolated once, onto the corpus grid
+        query = _l2_normalize(
+            _interp_to_grid(self._grid, current_strikes, current_pdf).astype(np.float32)
+        )
+        if not np.any(query):
+            return []
 
-        for hist_data in historical_data:
-            # Calculate similarity
-            similarity_score = self._calculate_similarity(
-                current_pdf=current_pdf,
-                current_strikes=current_strikes,
-                current_stats=current_stats,
-                hist_pdf=hist_data['pdf'],
-                hist_strikes=hist_data['strikes'],
-                hist_stats=hist_data['stats']
-            )
+        # 1. Statistical Feature Similarity (cheap, for all entries)
+        stats_sims = self._stats_similarity_batch(current_stats)
+
+        # Shape similarity is at most 1, so entries whose best possible
+        # combined score misses the threshold are skipped before the cosine
+        candidates = np.flatnonzero(SHAPE_WEIGHT + STATS_WEIGHT * stats_sims >= self.similarity_threshold)
+        if candidates.size == 0:
+            return []
+
+        # 2. PDF Shape Similarity against the remaining entries at once
+        if NUMBA_AVAILABLE and candidates.size > PARALLEL_SCAN_MIN_ROWS:
+            shape_sims = np.empty(candidates.size, dtype=np.float32)
+            _dot_rows_nb(query, self._H, candidates.astype(np.int64, copy=False), shape_sims)
+        else:
+            shape_sims = self._H[candidates] @ query
+        shape_sims = np.clip(shape_sims, 0.0, 1.0)
 
-            # Only include if above threshold
-            if similarity_score >= self.similarity_threshold:
-                match = {
-                    'date': hist_data['date'],
-                    'similarity': similarity_score,
-                    'stats': hist_data['stats'],
-                    'metadata': hist_data.get('metadata', {}),
-                    'description': self._generate_description(hist_data)
-                }
+        # 3. Combined score (weighted average)
+        scores = SHAPE_WEIGHT * shape_sims + STATS_WEIGHT * stats_sims[candidates]
 
-                matches.append(match)
+        # Only include if above threshold, best matches first
+        passing = np.flatnonzero(scores >= self.similarity_threshold)
+        k = min(self.max_matches, passing.size)
+        if k == 0:
+            return []
 
-        # Sort by similarity (highest first)
-        matches.sort(key=lambda x: x['similarity'], reverse=True)
+        # O(N) selection of the top k, then sort only those k
+        top = passing
+        if passing.size > k:
+            top = passing[np.argpartition(-scores[passing], k - 1)[:k]]
+        top = top[np.argsort(-scores[top], kind='stable')]
 
-        # Return top matches
-        return matches[:self.max_matches]
+        # Build dicts only for the survivors
+        matches = []
+        for i in top:
+            j = candidates[i]
+            hist_data = {'stats': self._stats_dicts[j], 'metadata': self._metadata[j]}
+            matches.append({
+                'date': self._dates[j],
+                'similarity': float(scores[i]),
+                'stats': self._stats_dicts[j],
+                'metadata': self._metadata[j],
+                'description': self._generate_description(hist_data)
+            })
+
+        return matches
 
     def _calculate_similarity(
         self,
@@ -125,7 +411,7 @@ class PDFPatternMatcher:
 
         # 3. Combined score (weighted average)
         # Shape is more important than stats
-        combined_score = 0.7 * shape_sim + 0.3 * stats_sim
+        combined_score = SHAPE_WEIGHT * shape_sim + STATS_WEIGHT * stats_sim
 
         return combined_score
 
@@ -153,22 +439,20 @@ class PDFPatternMatcher:
         max_strike = min(strikes1.max(), strikes2.max())
 
         # Create common grid
-        common_grid = np.linspace(min_strike, max_strike, 100)
+        common_grid = np.linspace(min_strike, max_strike, SHAPE_GRID_POINTS)
 
         # Interpolate both PDFs to common grid
         pdf1_interp = np.interp(common_grid, strikes1, pdf1)
         pdf2_interp = np.interp(common_grid, strikes2, pdf2)
 
-        # Normalize (ensure they sum to 1 over grid)
-        pdf1_norm = pdf1_interp / np.trapz(pdf1_interp, common_grid)
-        pdf2_norm = pdf2_interp / np.trapz(pdf2_interp, common_grid)
+        # No area normalization is needed: cosine similarity is scale-invariant.
+        # Cosine similarity is undefined for a zero vector
+        if not (np.any(pdf1_interp) and np.any(pdf2_interp)):
+            return 0.0
 
         # Calculate cosine similarity
         # (1 - cosine distance) since cosine distance is 0 for identical vectors
-        try:
-            similarity = 1 - cosine(pdf1_norm, pdf2_norm)
-        except:
-            similarity = 0.0
+        similarity = 1.0 - _cosine_distance(pdf1_interp, pdf2_interp)
 
         # Ensure in [0, 1] range
         return max(0.0, min(1.0, similarity))
@@ -181,7 +465,7 @@ class PDFPatternMatcher:
         """
         Calculate similarity of statistical features.
 
-        Compares: mean, std, skewness, kurtosis, implied_move
+        Compares STATS_FEATURES: skewness, excess kurtosis, implied move
 
         Args:
             stats1, stats2: Statistics dictionaries
@@ -189,32 +473,8 @@ class PDFPatternMatcher:
         Returns:
             Similarity score (0-1)
         """
-        # Features to compare
-        features = ['skewness', 'excess_kurtosis', 'implied_move_pct']
-
-        similarities = []
-
-        for feature in features:
-            if feature in stats1 and feature in stats2:
-                val1 = stats1[feature]
-                val2 = stats2[feature]
-
-                # Normalize difference to [0, 1] similarity
-                # Using exponential decay: sim = exp(-|diff| / scale)
-                if feature in ['skewness', 'excess_kurtosis']:
-                    scale = 1.0  # Typical range
-                else:  # implied_move_pct
-                    scale = 5.0  # Percentage points
-
-                diff = abs(val1 - val2)
-                sim = np.exp(-diff / scale)
-                similarities.append(sim)
-
-        # Average similarity across features
-        if similarities:
-            return np.mean(similarities)
-        else:
-            return 0.5  # Neutral if no comparable features
+        rows = _stats_similarity_rows(self._stats_vectors([stats2]), self._stats_vectors([stats1]))
+        return float(rows[0])
 
     def _generate_description(self, hist_data: Dict) -> str:
         """
@@ -229,32 +489,27 @@ class PDFPatternMatcher:
         stats = hist_data['stats']
         metadata = hist_data.get('metadata', {})
 
-        # Build description
-        parts = []
-
-        # Skewness description
+        # Skewness bucket
         skew = stats.get('skewness', 0)
         if skew < -0.3:
-            parts.append("heavy left tail")
+            skew_bucket = 'left'
         elif skew > 0.3:
-            parts.append("heavy right tail")
+            skew_bucket = 'right'
         else:
-            parts.append("symmetric")
+            skew_bucket = 'sym'
 
-        # Volatility level
+        # Volatility bucket
         impl_move = stats.get('implied_move_pct', 0)
         if impl_move > 4:
-            parts.append("high volatility")
+            vol_bucket = 'high'
         elif impl_move < 2:
-            parts.append("low volatility")
+            vol_bucket = 'low'
         else:
-            parts.append("moderate volatility")
+            vol_bucket = 'mod'
 
-        # Add any custom metadata
-        if 'event' in metadata:
-            parts.append(f"({metadata['event']})")
+        event = f"{metadata['event']}" if 'event' in metadata else None
 
-        return ", ".join(parts)
+        return _describe_buckets(skew_bucket, vol_bucket, event)
 
 
 def calculate_pattern_score(
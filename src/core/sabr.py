@@ -5,13 +5,59 @@ The SABR model is used to interpolate implied volatility across strikes,
 providing a smooth volatility surface needed for Breeden-Litzenberger.
 """
 
+import math
 import numpy as np
 from typing import Tuple, Optional
-from scipy.optimize import minimize, least_squares
+from scipy.optimize import least_squares
 from pysabr import Hagan2002LognormalSABR as SABR
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - the NumPy implementation is used instead
+    NUMBA_AVAILABLE = False
+
 from config.constants import SABR_BETA, SABR_INITIAL_ALPHA, SABR_INITIAL_RHO, SABR_INITIAL_NU
 
 
+if NUMBA_AVAILABLE:
+    # The calibration objective evaluates the formula hundreds of times, so
+    # the per-strike loop is compiled once (cache=True) for float64 strikes.
+    @njit(
+        'float64[::1](float64[::1], float64[::1], float64[::1], boolean[::1], '
+        'float64, float64, float64, float64, float64, float64, float64)',
+        fastmath=True, cache=True
+    )
+    def _sabr_vols_nb(z_base, inv_FK_half, inv_denom, is_atm, F_pow, c_alpha, c_rho,
+                      alpha, rho, nu, tau):
+        """Hagan et al. (2002) SABR implied volatility, one loop over strikes."""
+        alpha_term = c_alpha * alpha * alpha
+        rho_term = c_rho * rho * nu * alpha
+        nu_term = (2.0 - 3.0 * rho * rho) / 24.0 * nu * nu
+        atm_vol = alpha / F_pow * (
+            1.0 + (alpha_term / (F_pow * F_pow) + rho_term / F_pow + nu_term) * tau
+        )
+        nu_over_alpha = nu / alpha
+
+        vols = np.empty(z_base.shape[0])
+        for i in range(z_base.shape[0]):
+            if is_atm[i]:
+                vols[i] = atm_vol
+                continue
+
+            z = nu_over_alpha * z_base[i]
+            x_z = math.log((math.sqrt(1.0 - 2.0 * rho * z + z * z) + z - rho) / (1.0 - rho))
+            if abs(x_z) < 1e-10:
+                x_z = z
+
+            inv_half = inv_FK_half[i]
+            correction = 1.0 + (alpha_term * inv_half * inv_half +
+                                rho_term * inv_half + nu_term) * tau
+
+            vols[i] = alpha * inv_denom[i] * (z / x_z) * correction
+        return vols
+
+
 class SABRModel:
     """
     SABR model for implied volatility interpolation.
@@ -70,40 +116,32 @@ class SABRModel:
         if initial_guess is None:
             initial_guess = (SABR_INITIAL_ALPHA, SABR_INITIAL_RHO, SABR_INITIAL_NU)
 
-        # Objective function: minimize squared errors
-        def objective(params):
-            alpha, rho, nu = params
+        # Strike terms are fixed during calibration, only alpha/rho/nu vary
+        strike_terms = self._precompute_strike_terms(strikes, forward, self.beta)
 
-            # Parameter bounds constraints
-            if alpha <= 0 or nu <= 0 or rho < -1 or rho > 1:
-                return 1e10
-
-            try:
-                model_vols = self._sabr_formula(strikes, forward, alpha, rho, nu, self.beta, tau)
-                errors = (model_vols - implied_vols) ** 2
-                return np.sum(errors)
-            except:
-                return 1e10
-
-        # Optimize
-        result = minimize(
-            objective,
-            initial_guess,
-            method='Nelder-Mead',
-            options={'maxiter': 1000}
+        # Residuals for Levenberg-Marquardt style least squares, which uses
+        # the Jacobian and needs far fewer evaluations than Nelder-Mead
+        def residuals(params):
+            alpha, rho, nu = params
+            model_vols = self._sabr_formula_precomputed(strike_terms, alpha, rho, nu, tau)
+            errors = model_vols - implied_vols
+            # Penalize parameter regions where the expansion breaks down
+            return np.where(np.isfinite(errors), errors, 1e5)
+
+        # Optimize within the admissible parameter region. Alpha is quoted in
+        # F^(1-beta) units (alpha / F^(1-beta) is roughly the ATM vol), so its
+        # bounds scale with the forward.
+        F_pow = strike_terms[4]
+        lower = np.array([0.001 * F_pow, -0.999, 0.001])
+        upper = np.array([2.0 * F_pow, 0.999, 2.0])
+        result = least_squares(
+            residuals,
+            np.clip(initial_guess, lower, upper),
+            bounds=(lower, upper),
+            method='trf',
+            x_scale='jac'
         )
 
-        if not result.success:
-            # Try with L-BFGS-B with bounds
-            bounds = [(0.001, 2.0), (-0.999, 0.999), (0.001, 2.0)]
-            result = minimize(
-                objective,
-                initial_guess,
-                method='L-BFGS-B',
-                bounds=bounds,
-                options={'maxiter': 1000}
-            )
-
         # Store calibrated parameters
         self.alpha, self.rho, self.nu = result.x
         self.is_calibrated = True
@@ -141,76 +179,126 @@ class SABRModel:
         )
 
     @staticmethod
-    def _sabr_formula(
-        K: np.ndarray,
-        F: float,
+    def _precompute_strike_terms(K: np.ndarray, F: float, beta: float) -> tuple:
+        """
+        Strike-dependent terms of the SABR formula.
+
+        These depend only on strikes, forward and beta, so calibration
+        computes them once and reuses them for every objective evaluation.
+
+        Args:
+            K: Strikes
+            F: Forward price
+            beta: CEV exponent
+
+        Returns:
+            Tuple of (z_base, inv_FK_half, inv_denom, is_atm, F_pow, c_alpha, c_rho)
+        """
+        K = np.ascontiguousarray(np.atleast_1d(K), dtype=np.float64)
+        one_mb = 1 - beta
+
+        log_FK = np.log(F / K)
+        if beta == 0.5:
+            # Equity default: exponents 1/4 and 1/2 avoid the general pow()
+            FK_half = np.sqrt(np.sqrt(F * K))
+            F_pow = math.sqrt(F)
+        else:
+            FK_half = (F * K) ** (0.5 * one_mb)
+            F_pow = F ** one_mb
+
+        one_mb2 = one_mb * one_mb
+        log_FK2 = log_FK * log_FK
+        denom_series = 1 + one_mb2 / 24 * log_FK2 + one_mb2 * one_mb2 / 1920 * (log_FK2 * log_FK2)
+        is_atm = np.abs(K - F) < 1e-6
+
+        # Only alpha, rho and nu vary during calibration: keep the strike
+        # and beta dependent factors in the form the formula consumes them
+        with np.errstate(divide='ignore'):
+            z_base = FK_half * log_FK
+            inv_FK_half = 1.0 / FK_half
+            inv_denom = 1.0 / (FK_half * denom_series)
+        c_alpha = one_mb2 / 24
+        c_rho = 0.25 * beta
+
+        return z_base, inv_FK_half, inv_denom, is_atm, float(F_pow), float(c_alpha), float(c_rho)
+
+    @staticmethod
+    def _sabr_formula_precomputed(
+        terms: tuple,
         alpha: float,
         rho: float,
         nu: float,
-        beta: float,
         tau: float
     ) -> np.ndarray:
         """
-        SABR implied volatility formula (Hagan et al. 2002).
+        SABR implied volatility formula from precomputed strike terms.
 
         Args:
-            K: Strikes
-            F: Forward price
+            terms: Output of _precompute_strike_terms
             alpha: Initial volatility
             rho: Correlation
             nu: Volatility of volatility
-            beta: CEV exponent
             tau: Time to expiration
 
         Returns:
             Implied volatilities
         """
-        # Ensure inputs are arrays
-        K = np.atleast_1d(K)
-
-        # ATM case (avoid division by zero)
-        atm_vol = alpha / (F ** (1 - beta))
+        z_base, inv_FK_half, inv_denom, is_atm, F_pow, c_alpha, c_rho = terms
 
-        # For each strike
-        vols = np.zeros_like(K, dtype=float)
+        if NUMBA_AVAILABLE:
+            return _sabr_vols_nb(
+                z_base, inv_FK_half, inv_denom, is_atm, F_pow, c_alpha, c_rho,
+                float(alpha), float(rho), float(nu), float(tau)
+            )
 
-        for i, strike in enumerate(K):
-            if np.abs(strike - F) < 1e-6:
-                # ATM
-                vols[i] = atm_vol * (1 + ((1 - beta)**2 / 24 * alpha**2 / F**(2 - 2*beta) +
-                                          0.25 * rho * beta * nu * alpha / F**(1 - beta) +
-                                          (2 - 3*rho**2) / 24 * nu**2) * tau)
-            else:
-                # Non-ATM
-                try:
-                    FK = F * strike
-                    log_FK = np.log(F / strike)
+        alpha_term = c_alpha * alpha*alpha
+        rho_term = c_rho * rho * nu * alpha
+        nu_term = (2 - 3*rho*rho) / 24 * nu*nu
 
-                    z = (nu / alpha) * FK**((1 - beta) / 2) * log_FK
-                    x_z = np.log((np.sqrt(1 - 2*rho*z + z**2) + z - rho) / (1 - rho))
+        # ATM case (avoid division by zero)
+        vol_atm = alpha / F_pow * (1 + (alpha_term / (F_pow*F_pow) + rho_term / F_pow + nu_term) * tau)
 
-                    if np.abs(x_z) < 1e-10:
-                        x_z = z
+        # Non-ATM, for all strikes at once (ATM entries are discarded below)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (nu / alpha) * z_base
+            x_z = np.log((np.sqrt(1 - 2*rho*z + z*z) + z - rho) / (1 - rho))
+            x_z = np.where(np.abs(x_z) < 1e-10, z, x_z)
 
-                    num = alpha
-                    denom = FK**((1 - beta) / 2) * (
-                        1 + (1 - beta)**2 / 24 * log_FK**2 +
-                        (1 - beta)**4 / 1920 * log_FK**4
-                    )
+            vol_term = alpha * inv_denom * (z / x_z)
+            correction = 1 + (alpha_term * inv_FK_half*inv_FK_half + rho_term * inv_FK_half + nu_term) * tau
 
-                    vol_term = num / denom * (z / x_z)
+            vol_non_atm = vol_term * correction
 
-                    correction = (1 + ((1 - beta)**2 / 24 * alpha**2 / FK**(1 - beta) +
-                                      0.25 * rho * beta * nu * alpha / FK**((1 - beta) / 2) +
-                                      (2 - 3*rho**2) / 24 * nu**2) * tau)
+        return np.where(is_atm, vol_atm, vol_non_atm)
 
-                    vols[i] = vol_term * correction
+    @classmethod
+    def _sabr_formula(
+        cls,
+        K: np.ndarray,
+        F: float,
+        alpha: float,
+        rho: float,
+        nu: float,
+        beta: float,
+        tau: float
+    ) -> np.ndarray:
+        """
+        SABR implied volatility formula (Hagan et al. 2002).
 
-                except:
-                    # Fallback to ATM vol
-                    vols[i] = atm_vol
+        Args:
+            K: Strikes
+            F: Forward price
+            alpha: Initial volatility
+            rho: Correlation
+            nu: Volatility of volatility
+            beta: CEV exponent
+            tau: Time to expiration
 
-        return vols
+        Returns:
+            Implied volatilities
+        """
+        terms = cls._precompute_strike_terms(K, F, beta)
+        return cls._sabr_formula_precomputed(terms, alpha, rho, nu, tau)
 
 
 class CubicSplineInterpolator:
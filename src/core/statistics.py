@@ -10,19 +10,89 @@ Calculate key statistics from the PDF:
 - Tail probabilities
 """
 
+import sys
+import threading
 import numpy as np
-from typing import Dict, Optional
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Callable, Dict, Tuple
+
+# NumPy's trapezoid rule directly, without scipy's wrapper
+# (np.trapezoid since NumPy 2.0, np.trapz before)
+trapezoid = getattr(np, 'trapezoid', None) or np.trapz
 try:
-    from scipy.integrate import trapezoid, cumulative_trapezoid
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    # Fallback for older scipy versions
-    from scipy.integrate import trapz as trapezoid, cumtrapz as cumulative_trapezoid
-from scipy.stats import skew, kurtosis
+    # Numba is optional - the NumPy implementation is used instead
+    NUMBA_AVAILABLE = False
+
+# Spot-independent results (CDF, moments, quantiles) per PDF content, so a
+# PDF re-wrapped with a new spot price or expiry is not integrated again
+SHAPE_CACHE_SIZE = 64
+_SHAPE_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_SHAPE_CACHE_LOCK = threading.Lock()
+
+
+def _shape_entry(strikes: np.ndarray, pdf: np.ndarray) -> dict:
+    """
+    Get the shared results dict for a (strikes, pdf) pair, creating it if new.
+
+    Keyed by the full array contents, so equal PDFs share results whatever
+    the array objects are.
+    """
+    strikes = np.asarray(strikes)
+    pdf = np.asarray(pdf)
+    key = (strikes.dtype.str, strikes.tobytes(), pdf.dtype.str, pdf.tobytes())
+    with _SHAPE_CACHE_LOCK:
+        entry = _SHAPE_CACHE.get(key)
+        if entry is None:
+            entry = _SHAPE_CACHE[key] = {}
+            while len(_SHAPE_CACHE) > SHAPE_CACHE_SIZE:
+                _SHAPE_CACHE.popitem(last=False)
+        else:
+            _SHAPE_CACHE.move_to_end(key)
+    return entry
+
+
+if NUMBA_AVAILABLE:
+    @njit('float64[::1](float64[::1], float64[::1])', fastmath=True, cache=True)
+    def _moments_nb(x, pdf):
+        """Raw moments m0..m4 of the piecewise-linear PDF, one loop over segments."""
+        m = np.zeros(5)
+        for i in range(x.shape[0] - 1):
+            x1 = x[i]
+            x2 = x[i + 1]
+            dx = x2 - x1
+            if dx == 0.0:
+                continue
+            b = (pdf[i + 1] - pdf[i]) / dx
+            a = pdf[i] - b * x1
+
+            # Running powers x^(k+1) and x^(k+2) of both segment ends
+            p1 = x1
+            p2 = x2
+            for k in range(5):
+                q1 = p1 * x1
+                q2 = p2 * x2
+                m[k] += a / (k + 1) * (p2 - p1) + b / (k + 2) * (q2 - q1)
+                p1 = q1
+                p2 = q2
+        return m
 
 
 class PDFStatistics:
     """Calculate and store PDF statistics."""
 
+    # Order of the statistics in get_summary()
+    SUMMARY_KEYS = (
+        'mean', 'variance', 'std', 'skewness', 'excess_kurtosis',
+        'implied_move_pct', 'implied_volatility', 'median', 'mode',
+        'prob_down_5pct', 'prob_up_5pct', 'prob_down_10pct', 'prob_up_10pct',
+        'risk_neutral_drift_pct',
+        'ci_95_lower', 'ci_95_upper', 'ci_68_lower', 'ci_68_upper',
+    )
+
     def __init__(
         self,
         strikes: np.ndarray,
@@ -44,122 +114,202 @@ class PDFStatistics:
         self.spot = spot_price
         self.T = time_to_expiry
 
-        # Calculate all statistics
-        self.stats = self._calculate_all_statistics()
-
-    def _calculate_all_statistics(self) -> Dict[str, float]:
-        """Calculate all statistical measures."""
-        stats = {}
-
-        # Expected value (mean)
-        stats['mean'] = self.calculate_mean()
-
-        # Variance and standard deviation
-        stats['variance'] = self.calculate_variance(stats['mean'])
-        stats['std'] = np.sqrt(stats['variance'])
-
-        # Skewness (measure of asymmetry)
-        stats['skewness'] = self.calculate_skewness(stats['mean'], stats['std'])
-
-        # Excess kurtosis (measure of tail heaviness)
-        stats['excess_kurtosis'] = self.calculate_kurtosis(stats['mean'], stats['std'])
-
-        # Implied move (expected percentage change)
-        stats['implied_move_pct'] = (stats['std'] / self.spot) * 100
-
-        # Annualized volatility
-        stats['implied_volatility'] = stats['std'] / (self.spot * np.sqrt(self.T))
-
-        # Median (50th percentile)
-        stats['median'] = self.calculate_percentile(50)
-
-        # Mode (most likely value - peak of PDF)
-        max_idx = np.argmax(self.pdf)
-        stats['mode'] = self.strikes[max_idx]
-
-        # Tail probabilities
-        stats['prob_down_5pct'] = self.calculate_tail_probability(-5)
-        stats['prob_up_5pct'] = self.calculate_tail_probability(5)
-        stats['prob_down_10pct'] = self.calculate_tail_probability(-10)
-        stats['prob_up_10pct'] = self.calculate_tail_probability(10)
-
-        # Risk-neutral drift
-        stats['risk_neutral_drift_pct'] = ((stats['mean'] - self.spot) / self.spot) * 100
-
-        # Confidence intervals
-        stats['ci_95_lower'] = self.calculate_percentile(2.5)
-        stats['ci_95_upper'] = self.calculate_percentile(97.5)
-        stats['ci_68_lower'] = self.calculate_percentile(16)
-        stats['ci_68_upper'] = self.calculate_percentile(84)
-
-        return stats
-
-    def calculate_mean(self) -> float:
-        """
-        Calculate expected value (mean) of the distribution.
-
-        E[S] = ∫ S × f(S) dS
-        """
-        return trapezoid(self.strikes * self.pdf, self.strikes)
-
-    def calculate_variance(self, mean: Optional[float] = None) -> float:
-        """
-        Calculate variance.
-
-        Var[S] = E[(S - E[S])²] = ∫ (S - μ)² × f(S) dS
+        # Strike spacing for the CDF integral; evenly spaced strikes
+        # (np.linspace grids, interpolated PDFs) take a cheaper path
+        self._dx = np.diff(strikes)
+        self._uniform = len(self._dx) > 0 and np.allclose(self._dx, self._dx[0])
+
+        # Results that depend only on the PDF shape, shared between instances
+        self._shape = _shape_entry(strikes, pdf)
+
+    @cached_property
+    def stats(self) -> Dict[str, float]:
+        """All statistical measures, computed on first access."""
+        return {key: getattr(self, key) for key in self.SUMMARY_KEYS}
+
+    def _shared(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Get a shape-only result from the shared cache, computing it once."""
+        value = self._shape.get(name)
+        if value is None:
+            value = self._shape[name] = compute()
+        return value
+
+    @cached_property
+    def _cdf(self) -> np.ndarray:
+        # Normalized CDF, shared by every percentile lookup
+        return self._shared('cdf', self._compute_cdf)
+
+    @cached_property
+    def _moments(self) -> Tuple[float, float, float, float]:
+        # Mean, variance, skewness and excess kurtosis from a single pass
+        return self._shared('moments', self._compute_moments)
+
+    @cached_property
+    def _quantiles(self) -> np.ndarray:
+        # Confidence interval bounds and median in one CDF lookup
+        return self._shared('quantiles', lambda: np.interp(
+            [0.025, 0.16, 0.5, 0.84, 0.975], self._cdf, self.strikes
+        ))
+
+    def _compute_cdf(self) -> np.ndarray:
+        """Trapezoid-rule CDF over the strikes, normalized to end at 1."""
+        if self._uniform:
+            # Trapezoid rule with constant h: h × (Σ y[:i+1] - (y[0] + y[i]) / 2),
+            # where h cancels in the normalization
+            cdf = np.cumsum(self.pdf, dtype=np.float64)
+            cdf -= 0.5 * (self.pdf[0] + self.pdf)
+        else:
+            cdf = np.empty(len(self.pdf))
+            cdf[0] = 0.0
+            np.cumsum(self._dx * 0.5 * (self.pdf[:-1] + self.pdf[1:]), out=cdf[1:])
+        cdf /= cdf[-1]
+        return cdf
+
+    @cached_property
+    def mean(self) -> float:
+        """Expected value."""
+        return self._moments[0]
+
+    @cached_property
+    def variance(self) -> float:
+        return self._moments[1]
+
+    @cached_property
+    def std(self) -> float:
+        return np.sqrt(self.variance)
+
+    @cached_property
+    def skewness(self) -> float:
+        """Measure of asymmetry."""
+        return self._moments[2]
+
+    @cached_property
+    def excess_kurtosis(self) -> float:
+        """Measure of tail heaviness."""
+        return self._moments[3]
+
+    @cached_property
+    def implied_move_pct(self) -> float:
+        """Expected percentage change."""
+        return (self.std / self.spot) * 100
+
+    @cached_property
+    def implied_volatility(self) -> float:
+        """Annualized volatility."""
+        return self.std / (self.spot * np.sqrt(self.T))
+
+    @cached_property
+    def median(self) -> float:
+        """50th percentile."""
+        return self._quantiles[2]
+
+    @cached_property
+    def mode(self) -> float:
+        """Most likely value - peak of PDF."""
+        return self.strikes[np.argmax(self.pdf)]
+
+    @cached_property
+    def _tail_probs(self) -> np.ndarray:
+        # The four summary tail probabilities in one CDF lookup
+        return self.calculate_tail_probabilities([-10, -5, 5, 10])
+
+    @cached_property
+    def prob_down_5pct(self) -> float:
+        return self._tail_probs[1]
+
+    @cached_property
+    def prob_up_5pct(self) -> float:
+        return self._tail_probs[2]
+
+    @cached_property
+    def prob_down_10pct(self) -> float:
+        return self._tail_probs[0]
+
+    @cached_property
+    def prob_up_10pct(self) -> float:
+        return self._tail_probs[3]
+
+    @cached_property
+    def risk_neutral_drift_pct(self) -> float:
+        return ((self.mean - self.spot) / self.spot) * 100
+
+    @cached_property
+    def ci_95_lower(self) -> float:
+        return self._quantiles[0]
+
+    @cached_property
+    def ci_95_upper(self) -> float:
+        return self._quantiles[4]
+
+    @cached_property
+    def ci_68_lower(self) -> float:
+        return self._quantiles[1]
+
+    @cached_property
+    def ci_68_upper(self) -> float:
+        return self._quantiles[3]
+
+    def _compute_moments(self) -> Tuple[float, float, float, float]:
         """
-        if mean is None:
-            mean = self.calculate_mean()
+        Calculate mean, variance, skewness and excess kurtosis in one pass.
 
-        return trapezoid((self.strikes - mean)**2 * self.pdf, self.strikes)
-
-    def calculate_skewness(
-        self,
-        mean: Optional[float] = None,
-        std: Optional[float] = None
-    ) -> float:
-        """
-        Calculate skewness (measure of asymmetry).
+        The PDF is taken as piecewise linear between strikes, so each raw
+        moment ∫ S^k × f(S) dS has a closed form per segment. Strikes are
+        shifted to the middle of their range first, which keeps the raw
+        moments small and avoids cancellation when deriving central moments:
 
+        E[S] = μ,  Var[S] = E[(S - μ)²]
         Skew = E[(S - μ)³] / σ³
+        Kurtosis = E[(S - μ)⁴] / σ⁴ - 3
 
         Negative skew: left tail is heavier (more downside risk)
         Positive skew: right tail is heavier (more upside potential)
+        Excess kurtosis > 0: fat tails (more extreme events than normal distribution)
+        Excess kurtosis < 0: thin tails (fewer extreme events)
+
+        Returns:
+            Tuple of (mean, variance, skewness, excess_kurtosis)
         """
-        if mean is None:
-            mean = self.calculate_mean()
-        if std is None:
-            std = np.sqrt(self.calculate_variance(mean))
+        center = 0.5 * (self.strikes[0] + self.strikes[-1])
+        x = self.strikes - center
+
+        if NUMBA_AVAILABLE:
+            m = _moments_nb(
+                np.ascontiguousarray(x, dtype=np.float64),
+                np.ascontiguousarray(self.pdf, dtype=np.float64)
+            )
+        else:
+            x1, x2 = x[:-1], x[1:]
+            y1, y2 = self.pdf[:-1], self.pdf[1:]
 
-        if std == 0:
-            return 0.0
+            # f(S) = a + b×S on each segment (zero-width segments contribute 0)
+            dx = x2 - x1
+            b = np.divide(y2 - y1, dx, out=np.zeros_like(dx), where=dx != 0)
+            a = y1 - b * x1
 
-        third_moment = trapezoid((self.strikes - mean)**3 * self.pdf, self.strikes)
-        return third_moment / (std**3)
+            # m[k] = Σ a/(k+1) × (x2^(k+1) - x1^(k+1)) + b/(k+2) × (x2^(k+2) - x1^(k+2))
+            m = np.empty(5)
+            p1, p2 = x1, x2
+            for k in range(5):
+                q1, q2 = p1 * x1, p2 * x2
+                m[k] = np.sum(a / (k + 1) * (p2 - p1) + b / (k + 2) * (q2 - q1))
+                p1, p2 = q1, q2
 
-    def calculate_kurtosis(
-        self,
-        mean: Optional[float] = None,
-        std: Optional[float] = None
-    ) -> float:
-        """
-        Calculate excess kurtosis (measure of tail heaviness).
+        # Raw moments of the (normalized) distribution about the center
+        e1, e2, e3, e4 = m[1:] / m[0]
+        mu = e1
+        variance = e2 - mu**2
 
-        Kurtosis = E[(S - μ)⁴] / σ⁴ - 3
+        if variance <= 0:
+            return center + mu, 0.0, 0.0, 0.0
 
-        Excess kurtosis > 0: fat tails (more extreme events than normal distribution)
-        Excess kurtosis < 0: thin tails (fewer extreme events)
-        """
-        if mean is None:
-            mean = self.calculate_mean()
-        if std is None:
-            std = np.sqrt(self.calculate_variance(mean))
+        third = e3 - 3 * mu * e2 + 2 * mu**3
+        fourth = e4 - 4 * mu * e3 + 6 * mu**2 * e2 - 3 * mu**4
 
-        if std == 0:
-            return 0.0
+        skewness = third / variance**1.5
+        excess_kurtosis = fourth / variance**2 - 3
 
-        fourth_moment = trapezoid((self.strikes - mean)**4 * self.pdf, self.strikes)
-        return (fourth_moment / (std**4)) - 3
+        return center + mu, variance, skewness, excess_kurtosis
 
     def calculate_percentile(self, percentile: float) -> float:
         """
@@ -171,18 +321,8 @@ class PDFStatistics:
         Returns:
             Strike level at that percentile
         """
-        # Calculate CDF
-        cdf = cumulative_trapezoid(self.pdf, self.strikes, initial=0)
-        cdf = cdf / cdf[-1]  # Normalize
-
-        # Interpolate to find strike at percentile
-        from scipy.interpolate import interp1d
-        percentile_val = percentile / 100
-
-        # Find strike where CDF = percentile_val
-        strike_at_percentile = np.interp(percentile_val, cdf, self.strikes)
-
-        return strike_at_percentile
+        # Find strike where CDF = percentile / 100
+        return float(np.interp(percentile / 100, self._cdf, self.strikes))
 
     def calculate_tail_probability(self, percent_move: float) -> float:
         """
@@ -195,71 +335,75 @@ class PDFStatistics:
         Returns:
             Probability as decimal (0 to 1)
         """
-        target_price = self.spot * (1 + percent_move / 100)
+        return float(self.calculate_tail_probabilities([percent_move])[0])
 
-        if percent_move < 0:
-            # Probability of moving down more than percent_move
-            mask = self.strikes <= target_price
-        else:
-            # Probability of moving up more than percent_move
-            mask = self.strikes >= target_price
+    def calculate_tail_probabilities(self, percent_moves) -> np.ndarray:
+        """
+        Calculate tail probabilities for several moves with one CDF lookup.
 
-        prob = trapezoid(self.pdf[mask], self.strikes[mask])
-        return prob
+        Args:
+            percent_moves: Sequence of percentage moves (see calculate_tail_probability)
+
+        Returns:
+            Array of probabilities as decimals (0 to 1)
+        """
+        moves = np.asarray(percent_moves, dtype=float)
+        cdf_at = np.interp(self.spot * (1 + moves / 100), self.strikes, self._cdf)
+
+        # Downside: P(S < target); upside: P(S > target)
+        return np.where(moves < 0, cdf_at, 1 - cdf_at)
 
     def get_summary(self) -> Dict[str, float]:
-        """Get all statistics as dictionary."""
+        """Get all statistics as dictionary (computes any not yet accessed)."""
         return self.stats.copy()
 
     def print_summary(self) -> None:
         """Print formatted summary of statistics."""
-        print("\n" + "="*60)
-        print("PDF STATISTICS SUMMARY")
-        print("="*60)
-
-        print(f"\nCurrent Spot Price: ${self.spot:.2f}")
-        print(f"Time to Expiry: {self.T*365:.0f} days")
-
-        print(f"\n--- Central Tendency ---")
-        print(f"Expected Price (Mean):  ${self.stats['mean']:.2f}")
-        print(f"Median:                 ${self.stats['median']:.2f}")
-        print(f"Mode (Most Likely):     ${self.stats['mode']:.2f}")
-
-        print(f"\n--- Dispersion ---")
-        print(f"Standard Deviation:     ${self.stats['std']:.2f}")
-        print(f"Implied Move:           ±{self.stats['implied_move_pct']:.2f}%")
-        print(f"Implied Volatility:     {self.stats['implied_volatility']*100:.2f}%")
-
-        print(f"\n--- Shape ---")
-        print(f"Skewness:               {self.stats['skewness']:.3f}", end="")
-        if self.stats['skewness'] < -0.5:
-            print("  (strong negative skew - heavy left tail)")
-        elif self.stats['skewness'] > 0.5:
-            print("  (strong positive skew - heavy right tail)")
-        else:
-            print("  (approximately symmetric)")
+        stats = self.stats
 
-        print(f"Excess Kurtosis:        {self.stats['excess_kurtosis']:.3f}", end="")
-        if self.stats['excess_kurtosis'] > 0:
-            print("  (fat tails - more extreme events)")
+        if stats['skewness'] < -0.5:
+            skew_note = "strong negative skew - heavy left tail"
+        elif stats['skewness'] > 0.5:
+            skew_note = "strong positive skew - heavy right tail"
         else:
-            print("  (thin tails - fewer extreme events)")
-
-        print(f"\n--- Confidence Intervals ---")
-        print(f"68% CI:  ${self.stats['ci_68_lower']:.2f} - ${self.stats['ci_68_upper']:.2f}")
-        print(f"95% CI:  ${self.stats['ci_95_lower']:.2f} - ${self.stats['ci_95_upper']:.2f}")
-
-        print(f"\n--- Tail Probabilities ---")
-        print(f"P(Down >5%):  {self.stats['prob_down_5pct']*100:.2f}%")
-        print(f"P(Up >5%):    {self.stats['prob_up_5pct']*100:.2f}%")
-        print(f"P(Down >10%): {self.stats['prob_down_10pct']*100:.2f}%")
-        print(f"P(Up >10%):   {self.stats['prob_up_10pct']*100:.2f}%")
-
-        print(f"\n--- Risk-Neutral Drift ---")
-        print(f"Drift from Spot: {self.stats['risk_neutral_drift_pct']:+.2f}%")
-
-        print("="*60 + "\n")
+            skew_note = "approximately symmetric"
 
+        if stats['excess_kurtosis'] > 0:
+            kurtosis_note = "fat tails - more extreme events"
+        else:
+            kurtosis_note = "thin tails - fewer extreme events"
+
+        # Built as one string and written once instead of line by line
+        rule = "=" * 60
+        sys.stdout.write(
+            f"\n{rule}\n"
+            f"PDF STATISTICS SUMMARY\n"
+            f"{rule}\n"
+            f"\nCurrent Spot Price: ${self.spot:.2f}\n"
+            f"Time to Expiry: {self.T*365:.0f} days\n"
+            f"\n--- Central Tendency ---\n"
+            f"Expected Price (Mean):  ${stats['mean']:.2f}\n"
+            f"Median:                 ${stats['median']:.2f}\n"
+            f"Mode (Most Likely):     ${stats['mode']:.2f}\n"
+            f"\n--- Dispersion ---\n"
+            f"Standard Deviation:     ${stats['std']:.2f}\n"
+            f"Implied Move:           ±{stats['implied_move_pct']:.2f}%\n"
+            f"Implied Volatility:     {stats['implied_volatility']*100:.2f}%\n"
+            f"\n--- Shape ---\n"
+            f"Skewness:               {stats['skewness']:.3f}  ({skew_note})\n"
+            f"Excess Kurtosis:        {stats['excess_kurtosis']:.3f}  ({kurtosis_note})\n"
+            f"\n--- Confidence Intervals ---\n"
+            f"68% CI:  ${stats['ci_68_lower']:.2f} - ${stats['ci_68_upper']:.2f}\n"
+            f"95% CI:  ${stats['ci_95_lower']:.2f} - ${stats['ci_95_upper']:.2f}\n"
+            f"\n--- Tail Probabilities ---\n"
+            f"P(Down >5%):  {stats['prob_down_5pct']*100:.2f}%\n"
+            f"P(Up >5%):    {stats['prob_up_5pct']*100:.2f}%\n"
+            f"P(Down >10%): {stats['prob_down_10pct']*100:.2f}%\n"
+            f"P(Up >10%):   {stats['prob_up_10pct']*100:.2f}%\n"
+            f"\n--- Risk-Neutral Drift ---\n"
+            f"Drift from Spot: {stats['risk_neutral_drift_pct']:+.2f}%\n"
+            f"{rule}\n\n"
+        )
 
 def calculate_pdf_statistics(
     strikes: np.ndarray,
@@ -3,76 +3,233 @@ Data caching layer to reduce API calls and improve performance.
 """
 
 import os
-import json
+import re
+import glob
 import pickle
-from typing import Any, Optional, Callable
+import importlib.util
+from typing import Any, Optional, Callable, Sequence
 from datetime import datetime, timedelta
 from pathlib import Path
 import pandas as pd
+import threading
+from collections import OrderedDict
 from functools import wraps
 
+# DataFrames are stored as Feather (Arrow IPC) when pyarrow is installed:
+# smaller and much faster to load than pickle. Checked without importing
+# pyarrow, which pandas loads on first use anyway.
+FEATHER_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Characters replaced by '_' to turn a cache key into a file name
+_KEY_TRANS = str.maketrans({'/': '_', ':': '_', ' ': '_'})
+
+# Feather files holding the second and later frames of a cached tuple
+_EXTRA_PART_RE = re.compile(r'\.part[1-9][0-9]*\.feather$')
+
+# Copy-on-Write is always on from pandas 3
+_PANDAS_ALWAYS_COW = int(pd.__version__.split('.')[0]) >= 3
+
+
+def _copy_on_write_enabled() -> bool:
+    """True if pandas Copy-on-Write is active (so shallow copies are safe)."""
+    return _PANDAS_ALWAYS_COW or pd.options.mode.copy_on_write is True
+
 
 class DataCache:
     """Simple file-based cache for data fetching."""
 
-    def __init__(self, cache_dir: str = ".cache", ttl_minutes: int = 15):
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        ttl_minutes: int = 15,
+        memory_items: int = 32
+    ):
         """
         Initialize data cache.
 
         Args:
             cache_dir: Directory to store cache files
             ttl_minutes: Time-to-live for cached data in minutes
+            memory_items: Number of recently read entries kept in memory
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.ttl = timedelta(minutes=ttl_minutes)
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get path for cache file."""
-        # Sanitize key for filesystem
-        safe_key = key.replace('/', '_').replace(':', '_').replace(' ', '_')
-        return self.cache_dir / f"{safe_key}.pkl"
+        # In-process LRU in front of the files, keyed by (key, file mtime)
+        # so an entry rewritten on disk is never served stale
+        self.memory_items = memory_items
+        self._mem = OrderedDict()
+        self._mem_lock = threading.Lock()
+
+    @staticmethod
+    def _safe_key(key: str) -> str:
+        """Sanitize key for filesystem."""
+        return key.translate(_KEY_TRANS)
+
+    def _get_cache_path(self, safe_key: str, suffix: str = '.pkl') -> Path:
+        """Get path for cache file (from an already sanitized key)."""
+        return self.cache_dir / f"{safe_key}{suffix}"
+
+    def _get_data_paths(self, safe_key: str) -> list:
+        """Get paths of every data file (any format) stored for safe_key."""
+        pickle_path = self._get_cache_path(safe_key)
+        feather_path = self._get_cache_path(safe_key, '.feather')
+        parts = self.cache_dir.glob(f"{glob.escape(feather_path.stem)}.part*.feather")
+        return [pickle_path, feather_path, *parts]
+
+    @staticmethod
+    def _shallow_copy(data: Any) -> Any:
+        """
+        Copy DataFrames before handing them out of the memory cache.
+
+        With Copy-on-Write (pandas 3, or enabled on 2.x) only the container
+        is copied: callers that add or drop columns or edit values then
+        cannot alter the cached object. Without it an in-place value edit
+        would write through a shallow copy, so values are copied too, which
+        also makes frames backed by a read-only memory map writable.
+        """
+        if isinstance(data, pd.DataFrame):
+            return data.copy(deep=not _copy_on_write_enabled())
+        if isinstance(data, tuple):
+            return tuple(DataCache._shallow_copy(d) for d in data)
+        if isinstance(data, list):
+            return list(data)
+        return data
+
+    def _remember(self, mem_key: tuple, data: Any) -> None:
+        """Store a loaded entry in the memory LRU."""
+        with self._mem_lock:
+            self._mem[mem_key] = data
+            self._mem.move_to_end(mem_key)
+            while len(self._mem) > self.memory_items:
+                self._mem.popitem(last=False)
+
+    def _forget(self, key: Optional[str] = None) -> None:
+        """Drop memory entries for key (all entries if key is None)."""
+        with self._mem_lock:
+            if key is None:
+                self._mem.clear()
+            else:
+                for mem_key in [k for k in self._mem if k[0] == key]:
+                    del self._mem[mem_key]
+
+    @staticmethod
+    def _is_frames(data: Any) -> bool:
+        """Whether data is a DataFrame or a tuple of DataFrames."""
+        if isinstance(data, tuple):
+            return len(data) > 0 and all(isinstance(d, pd.DataFrame) for d in data)
+        return isinstance(data, pd.DataFrame)
+
+    def _find_entry(self, safe_key: str) -> Optional[tuple]:
+        """
+        Locate the stored data file for safe_key.
+
+        The file's mtime is the time the entry was written, so no separate
+        metadata file is needed.
 
-    def _get_metadata_path(self, key: str) -> Path:
-        """Get path for metadata file."""
-        safe_key = key.replace('/', '_').replace(':', '_').replace(' ', '_')
-        return self.cache_dir / f"{safe_key}_meta.json"
+        Returns:
+            Tuple of (format, path, stat result) or None if not cached
+        """
+        candidates = (
+            ('pickle', self._get_cache_path(safe_key)),
+            ('feather', self._get_cache_path(safe_key, '.feather')),
+            ('feather_parts', self._get_cache_path(safe_key, '.part0.feather')),
+        )
+        for fmt, path in candidates:
+            try:
+                return fmt, path, path.stat()
+            except FileNotFoundError:
+                continue
+        return None
+
+    @staticmethod
+    def _project(data: Any, columns: Sequence[str]) -> Any:
+        """Select columns from a DataFrame or from each frame of a tuple."""
+        if isinstance(data, pd.DataFrame):
+            return data[list(columns)]
+        if isinstance(data, tuple):
+            return tuple(DataCache._project(d, columns) for d in data)
+        return data
+
+    @staticmethod
+    def _read_feather(path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Read a Feather file through a memory map.
 
-    def get(self, key: str) -> Optional[Any]:
+        Only the requested columns are paged in from disk.
+        """
+        from pyarrow import feather
+        table = feather.read_table(
+            str(path), columns=list(columns) if columns is not None else None, memory_map=True
+        )
+        return table.to_pandas()
+
+    @staticmethod
+    def _write_file(path: Path, write: Callable[[Path], None]) -> None:
+        """Write via a temporary file and rename, so readers never see partial data."""
+        tmp_path = path.with_name(path.name + '.tmp')
+        write(tmp_path)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str, columns: Optional[Sequence[str]] = None) -> Optional[Any]:
         """
         Get data from cache if it exists and is not expired.
 
         Args:
             key: Cache key
+            columns: Optional DataFrame columns to load (applied to each
+                frame of a cached tuple); Feather entries read only these
 
         Returns:
             Cached data or None if not found or expired
         """
-        cache_path = self._get_cache_path(key)
-        meta_path = self._get_metadata_path(key)
+        safe_key = self._safe_key(key)
 
         # Check if cache exists
-        if not cache_path.exists() or not meta_path.exists():
+        entry = self._find_entry(safe_key)
+        if entry is None:
             return None
+        fmt, path, stat = entry
 
-        try:
-            # Read metadata
-            with open(meta_path, 'r') as f:
-                metadata = json.load(f)
-
-            # Check if expired
-            cached_time = datetime.fromisoformat(metadata['timestamp'])
-            if datetime.now() - cached_time > self.ttl:
-                # Cache expired, remove files
-                cache_path.unlink(missing_ok=True)
-                meta_path.unlink(missing_ok=True)
-                return None
+        # Check if expired
+        cached_time = datetime.fromtimestamp(stat.st_mtime)
+        if datetime.now() - cached_time > self.ttl:
+            # Cache expired, remove files
+            self.clear(key)
+            return None
 
-            # Read cached data
-            with open(cache_path, 'rb') as f:
-                data = pickle.load(f)
+        # Unchanged entries read before are served without disk I/O
+        mem_key = (key, stat.st_mtime_ns)
+        with self._mem_lock:
+            data = self._mem.get(mem_key)
+            if data is not None:
+                self._mem.move_to_end(mem_key)
 
-            return data
+        try:
+            if data is not None:
+                if columns is not None:
+                    return self._project(data, columns)
+                return self._shallow_copy(data)
+
+            # Read cached data in the format it was written
+            if fmt == 'pickle':
+                data = pickle.loads(path.read_bytes())
+            elif fmt == 'feather':
+                data = self._read_feather(path, columns)
+            else:
+                frames = []
+                while path.exists():
+                    frames.append(self._read_feather(path, columns))
+                    path = self._get_cache_path(safe_key, f'.part{len(frames)}.feather')
+                data = tuple(frames)
+
+            if columns is None:
+                self._remember(mem_key, data)
+                return self._shallow_copy(data)
+
+            # Partial reads are not remembered; pickles are projected after loading
+            return data if fmt != 'pickle' else self._project(data, columns)
 
         except Exception as e:
             print(f"Warning: Failed to read cache for {key}: {str(e)}")
@@ -86,21 +243,34 @@ class DataCache:
             key: Cache key
             data: Data to cache
         """
-        cache_path = self._get_cache_path(key)
-        meta_path = self._get_metadata_path(key)
+        safe_key = self._safe_key(key)
+        self._forget(key)
 
         try:
-            # Write data
-            with open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
-
-            # Write metadata
-            metadata = {
-                'timestamp': datetime.now().isoformat(),
-                'key': key
-            }
-            with open(meta_path, 'w') as f:
-                json.dump(metadata, f)
+            # Drop files a previous write may have left in another format
+            for path in self._get_data_paths(safe_key):
+                path.unlink(missing_ok=True)
+
+            # Write data: DataFrames (e.g. (calls, puts) tuples) as Feather
+            if FEATHER_AVAILABLE and self._is_frames(data):
+                try:
+                    if isinstance(data, tuple):
+                        # Part 0 marks the entry as present, so it goes last
+                        for i in range(len(data) - 1, -1, -1):
+                            self._write_file(
+                                self._get_cache_path(safe_key, f'.part{i}.feather'),
+                                data[i].to_feather
+                            )
+                    else:
+                        self._write_file(self._get_cache_path(safe_key, '.feather'), data.to_feather)
+                    return
+                except Exception:
+                    # Frames Arrow cannot represent are pickled instead
+                    for path in self._get_data_paths(safe_key):
+                        path.unlink(missing_ok=True)
+
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write_file(self._get_cache_path(safe_key), lambda path: path.write_bytes(payload))
 
         except Exception as e:
             print(f"Warning: Failed to write cache for {key}: {str(e)}")
@@ -112,12 +282,12 @@ class DataCache:
         Args:
             key: Optional specific key to clear. If None, clears all cache.
         """
+        self._forget(key or None)
+
         if key:
             # Clear specific key
-            cache_path = self._get_cache_path(key)
-            meta_path = self._get_metadata_path(key)
-            cache_path.unlink(missing_ok=True)
-            meta_path.unlink(missing_ok=True)
+            for path in self._get_data_paths(self._safe_key(key)):
+                path.unlink(missing_ok=True)
         else:
             # Clear all cache
             for file in self.cache_dir.glob('*'):
@@ -129,7 +299,11 @@ class DataCache:
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        files = list(self.cache_dir.glob('*.pkl'))
+        # One data file per entry (part 0 stands for a tuple's other parts)
+        files = [
+            f for f in self.cache_dir.glob('*')
+            if f.suffix in ('.pkl', '.feather') and not _EXTRA_PART_RE.search(f.name)
+        ]
         total_size = self.get_size()
 
         return {
@@ -2,7 +2,9 @@
 Unified data manager with automatic fallback between data sources.
 """
 
-from typing import Optional, Tuple, List
+from typing import Any, Callable, Dict, Optional, Tuple, List
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import pandas as pd
 from datetime import datetime
 
@@ -13,6 +15,16 @@ from src.data.cache import DataCache
 from config.settings import DATA_SOURCE_PRIORITY, CACHE_TTL_MINUTES
 from config.constants import MIN_EXPIRY_DAYS, MAX_EXPIRY_DAYS
 
+# Default source order, fixed at import (iterated only, never mutated)
+_DEFAULT_SOURCES = tuple(DATA_SOURCE_PRIORITY)
+
+# Shared by all DataManager instances to query data sources concurrently
+_SOURCE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="data-source")
+
+# Fetches currently in flight, by request key (see DataManager._single_flight)
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 
 class DataManager:
     """
@@ -48,6 +60,90 @@ class DataManager:
         # Track which data source is currently working
         self.active_source = None
 
+    @staticmethod
+    def _single_flight(key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch once for concurrent callers asking for the same key.
+
+        The first caller fetches; callers arriving while it is in flight
+        wait for and share its result (or exception). The registry is
+        module-level because the app creates a DataManager per request.
+
+        Args:
+            key: Request identity (cache key plus forced source)
+            fetch: Zero-argument function doing the actual fetch
+
+        Returns:
+            Result of fetch
+        """
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            leader = future is None
+            if leader:
+                future = _INFLIGHT[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[key]
+
+    @staticmethod
+    def _fetch_first(
+        sources: Tuple[str, ...],
+        fetchers: Dict[str, Callable[[], Any]]
+    ) -> Tuple[Optional[str], Any, Optional[Exception]]:
+        """
+        Query data sources concurrently and keep the first successful reply.
+
+        A slow or hanging provider no longer delays the fallback: every
+        source runs at once on the shared pool and the wall-clock cost is
+        that of the fastest working one.
+
+        Args:
+            sources: Data sources to try (unknown names are skipped)
+            fetchers: Zero-argument fetch function per data source
+
+        Returns:
+            Tuple of (source, result, last_error); source is None if all failed
+        """
+        sources = [source for source in sources if source in fetchers]
+        last_error = None
+
+        # A single source is called directly, no thread hop needed
+        if len(sources) == 1:
+            try:
+                return sources[0], fetchers[sources[0]](), None
+            except Exception as e:
+                print(f"Warning: {sources[0]} failed: {str(e)}")
+                return None, None, e
+
+        futures = {_SOURCE_POOL.submit(fetchers[source]): source for source in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                last_error = e
+                print(f"Warning: {source} failed: {str(e)}")
+                continue
+
+            # Drop requests that have not started; running ones finish unused
+            for other in futures:
+                other.cancel()
+            return source, result, None
+
+        return None, None, last_error
+
     def get_options(
         self,
         ticker: str = "SPY",
@@ -74,41 +170,44 @@ class DataManager:
             if cached_data is not None:
                 return cached_data
 
-        # Determine data sources to try
-        if force_source:
-            sources = [force_source]
-        else:
-            sources = DATA_SOURCE_PRIORITY.copy()
-
-        # Try each data source in priority order
-        last_error = None
-        for source in sources:
-            try:
-                if source == 'openbb':
-                    data = self.openbb_client.get_spy_options(
-                        ticker=ticker,
-                        min_expiry_days=min_expiry_days,
-                        max_expiry_days=max_expiry_days
-                    )
-                elif source == 'yfinance':
-                    data = self.yfinance_client.get_spy_options(
-                        ticker=ticker,
-                        min_expiry_days=min_expiry_days,
-                        max_expiry_days=max_expiry_days
-                    )
-                else:
-                    continue
-
-                # Success! Cache and return
-                self.active_source = source
-                if self.use_cache:
-                    self.cache.set(cache_key, data)
-                return data
+        # Concurrent identical requests share one fetch
+        return self._single_flight(
+            f"{cache_key}:{force_source}",
+            lambda: self._load_options(ticker, min_expiry_days, max_expiry_days, force_source, cache_key)
+        )
 
-            except Exception as e:
-                last_error = e
-                print(f"Warning: {source} failed: {str(e)}")
-                continue
+    def _load_options(
+        self,
+        ticker: str,
+        min_expiry_days: int,
+        max_expiry_days: int,
+        force_source: Optional[str],
+        cache_key: str
+    ) -> pd.DataFrame:
+        """Fetch option chain data from the sources and cache it."""
+        # Determine data sources to try
+        sources = (force_source,) if force_source else _DEFAULT_SOURCES
+
+        # Query the sources concurrently, first success wins
+        source, data, last_error = self._fetch_first(sources, {
+            'openbb': lambda: self.openbb_client.get_spy_options(
+                ticker=ticker,
+                min_expiry_days=min_expiry_days,
+                max_expiry_days=max_expiry_days
+            ),
+            'yfinance': lambda: self.yfinance_client.get_spy_options(
+                ticker=ticker,
+                min_expiry_days=min_expiry_days,
+                max_expiry_days=max_expiry_days
+            ),
+        })
+
+        if source is not None:
+            # Success! Cache and return
+            self.active_source = source
+            if self.use_cache:
+                self.cache.set(cache_key, data)
+            return data
 
         # All sources failed
         raise RuntimeError(
@@ -138,28 +237,33 @@ class DataManager:
             if cached_data is not None:
                 return cached_data
 
+        # Concurrent identical requests share one fetch
+        return self._single_flight(
+            f"{cache_key}:{force_source}",
+            lambda: self._load_spot_price(ticker, force_source, cache_key)
+        )
+
+    def _load_spot_price(
+        self,
+        ticker: str,
+        force_source: Optional[str],
+        cache_key: str
+    ) -> float:
+        """Fetch the spot price from the sources and cache it."""
         # Determine sources
-        sources = [force_source] if force_source else DATA_SOURCE_PRIORITY.copy()
+        sources = (force_source,) if force_source else _DEFAULT_SOURCES
 
-        # Try each source
-        last_error = None
-        for source in sources:
-            try:
-                if source == 'openbb':
-                    price = self.openbb_client.get_spot_price(ticker)
-                elif source == 'yfinance':
-                    price = self.yfinance_client.get_spot_price(ticker)
-                else:
-                    continue
-
-                # Cache and return
-                if self.use_cache:
-                    self.cache.set(cache_key, price)
-                return price
+        # Query the sources concurrently, first success wins
+        source, price, last_error = self._fetch_first(sources, {
+            'openbb': lambda: self.openbb_client.get_spot_price(ticker),
+            'yfinance': lambda: self.yfinance_client.get_spot_price(ticker),
+        })
 
-            except Exception as e:
-                last_error = e
-                continue
+        if source is not None:
+            # Cache and return
+            if self.use_cache:
+                self.cache.set(cache_key, price)
+            return price
 
         raise RuntimeError(
             f"Failed to fetch spot price for {ticker}. Last error: {str(last_error)}"
@@ -185,6 +289,18 @@ class DataManager:
             if cached_data is not None:
                 return cached_data
 
+        # Concurrent identical requests share one fetch
+        return self._single_flight(
+            cache_key,
+            lambda: self._load_risk_free_rate(days_to_maturity, cache_key)
+        )
+
+    def _load_risk_free_rate(
+        self,
+        days_to_maturity: Optional[int],
+        cache_key: str
+    ) -> float:
+        """Fetch the risk-free rate from FRED and cache it."""
         # Fetch from FRED with fallback
         try:
             if days_to_maturity:
@@ -225,33 +341,38 @@ class DataManager:
             if cached_data is not None:
                 return cached_data
 
-        # Determine sources
-        sources = [force_source] if force_source else DATA_SOURCE_PRIORITY.copy()
-
-        # Try each source
-        last_error = None
-        for source in sources:
-            try:
-                if source == 'openbb':
-                    calls, puts = self.openbb_client.get_options_by_expiration(
-                        expiration_date, ticker
-                    )
-                elif source == 'yfinance':
-                    calls, puts = self.yfinance_client.get_options_by_expiration(
-                        expiration_date, ticker
-                    )
-                else:
-                    continue
-
-                # Cache and return
-                result = (calls, puts)
-                if self.use_cache:
-                    self.cache.set(cache_key, result)
-                return result
+        # Concurrent identical requests share one fetch
+        return self._single_flight(
+            f"{cache_key}:{force_source}",
+            lambda: self._load_options_by_expiration(expiration_date, ticker, force_source, cache_key)
+        )
 
-            except Exception as e:
-                last_error = e
-                continue
+    def _load_options_by_expiration(
+        self,
+        expiration_date: str,
+        ticker: str,
+        force_source: Optional[str],
+        cache_key: str
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Fetch calls and puts for an expiration from the sources and cache them."""
+        # Determine sources
+        sources = (force_source,) if force_source else _DEFAULT_SOURCES
+
+        # Query the sources concurrently, first success wins
+        source, result, last_error = self._fetch_first(sources, {
+            'openbb': lambda: tuple(
+                self.openbb_client.get_options_by_expiration(expiration_date, ticker)
+            ),
+            'yfinance': lambda: tuple(
+                self.yfinance_client.get_options_by_expiration(expiration_date, ticker)
+            ),
+        })
+
+        if source is not None:
+            # Cache and return
+            if self.use_cache:
+                self.cache.set(cache_key, result)
+            return result
 
         raise RuntimeError(
             f"Failed to fetch options for {expiration_date}. Last error: {str(last_error)}"
@@ -279,33 +400,74 @@ class DataManager:
             if cached_data is not None:
                 return cached_data
 
+        # Concurrent identical requests share one fetch
+        return self._single_flight(
+            f"{cache_key}:{force_source}",
+            lambda: self._load_expirations(ticker, force_source, cache_key)
+        )
+
+    def _load_expirations(
+        self,
+        ticker: str,
+        force_source: Optional[str],
+        cache_key: str
+    ) -> List[str]:
+        """Fetch expiration dates from the sources and cache them."""
         # Determine sources
-        sources = [force_source] if force_source else DATA_SOURCE_PRIORITY.copy()
+        sources = (force_source,) if force_source else _DEFAULT_SOURCES
 
-        # Try each source
-        last_error = None
-        for source in sources:
-            try:
-                if source == 'openbb':
-                    expirations = self.openbb_client.get_option_expirations(ticker)
-                elif source == 'yfinance':
-                    expirations = self.yfinance_client.get_option_expirations(ticker)
-                else:
-                    continue
-
-                # Cache and return
-                if self.use_cache:
-                    self.cache.set(cache_key, expirations)
-                return expirations
+        # Query the sources concurrently, first success wins
+        source, expirations, last_error = self._fetch_first(sources, {
+            'openbb': lambda: self.openbb_client.get_option_expirations(ticker),
+            'yfinance': lambda: self.yfinance_client.get_option_expirations(ticker),
+        })
 
-            except Exception as e:
-                last_error = e
-                continue
+        if source is not None:
+            # Cache and return
+            if self.use_cache:
+                self.cache.set(cache_key, expirations)
+            return expirations
 
         raise RuntimeError(
             f"Failed to fetch expirations for {ticker}. Last error: {str(last_error)}"
         )
 
+    def prefetch(self, ticker: str = "SPY", days: int = 30) -> Dict[str, Any]:
+        """
+        Fetch spot price, risk-free rate and option chain concurrently.
+
+        The three requests are independent, so a cold start costs the
+        slowest of them rather than their sum. Results land in the cache,
+        making the individual getters free afterwards.
+
+        Args:
+            ticker: Ticker symbol
+            days: Maturity in days for the risk-free rate
+
+        Returns:
+            Dictionary with 'spot_price', 'risk_free_rate' and 'options'
+            (None for any that failed)
+        """
+        requests = {
+            'spot_price': lambda: self.get_spot_price(ticker),
+            'risk_free_rate': lambda: self.get_risk_free_rate(days),
+            'options': lambda: self.get_options(ticker),
+        }
+
+        # Own short-lived pool: the getters wait on _SOURCE_POOL themselves
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+            futures = {pool.submit(fetch): name for name, fetch in requests.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    print(f"Warning: prefetch of {name} for {ticker} failed: {str(e)}")
+                    results[name] = None
+
+        return results
+
     def clear_cache(self, key: Optional[str] = None) -> None:
         """Clear cache."""
         if self.cache:
@@ -4,9 +4,15 @@ FRED (Federal Reserve Economic Data) client for fetching risk-free interest rate
 
 import os
 import ssl
-from typing import Optional
-from datetime import datetime, timedelta
-from fredapi import Fred
+import time
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional, Tuple
+from datetime import date, datetime, timedelta
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 import certifi
 
@@ -17,10 +23,145 @@ load_dotenv()
 os.environ['SSL_CERT_FILE'] = certifi.where()
 os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
 
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# One keep-alive session for every FRED request: concurrent curve fetches
+# reuse pooled connections instead of a TCP + TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+
+# Retries for transient FRED failures: attempts and exponential backoff (seconds)
+FRED_MAX_ATTEMPTS = 3
+FRED_RETRY_BASE_SECONDS = 0.5
+FRED_RETRY_MAX_SECONDS = 4
+
+# Treasury yields update at most daily, so fetched rates are reused for an hour
+RATE_CACHE_TTL_SECONDS = 3600
+
+# When FRED has no observation in the window, a stored rate is only used in
+# its place if it was fetched within this many days (covers long weekends)
+STORED_RATE_MAX_AGE_DAYS = 5
+
+# Process-wide rate cache: (series_id, days) -> (rate, expiry on the monotonic clock)
+_RATE_CACHE: Dict[Tuple[str, int], Tuple[float, float]] = {}
+_RATE_CACHE_LOCK = threading.Lock()
+
+
+def _get_with_retry(url: str, params: dict) -> requests.Response:
+    """
+    GET over the shared session, retrying transient failures with backoff.
+
+    Connection errors, timeouts, rate limiting (429) and server errors (5xx)
+    are retried up to FRED_MAX_ATTEMPTS times, waiting 0.5s, 1s, ... (capped).
+
+    Args:
+        url: Request URL
+        params: Query parameters
+
+    Returns:
+        Response (possibly a non-retryable error status)
+    """
+    for attempt in range(FRED_MAX_ATTEMPTS):
+        try:
+            response = _SESSION.get(url, params=params, timeout=10)
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            error = ValueError(f"HTTP {response.status_code}")
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+
+        if attempt + 1 < FRED_MAX_ATTEMPTS:
+            time.sleep(min(FRED_RETRY_BASE_SECONDS * 2 ** attempt, FRED_RETRY_MAX_SECONDS))
+
+    raise error
+
+
+def _load_stored_rate(
+    key: Tuple[str, int],
+    latest: bool = False,
+    max_age_days: Optional[int] = None
+) -> Optional[float]:
+    """
+    Get today's rate for key from the database cache.
+
+    Args:
+        key: (series_id, days)
+        latest: Accept the most recently stored rate from any day
+        max_age_days: With latest, ignore rates stored more than this many days ago
+
+    Returns:
+        Rate as decimal, or None if not stored (or the database is unavailable)
+    """
+    try:
+        from src.database.db_config import db_session
+        from src.database.models import FREDRateCache
+
+        with db_session() as session:
+            if latest:
+                series_id, days = key
+                query = session.query(FREDRateCache).filter(
+                    FREDRateCache.series_id == series_id,
+                    FREDRateCache.days == days
+                )
+                if max_age_days is not None:
+                    # as_of is an ISO date string, so it compares chronologically
+                    cutoff = (date.today() - timedelta(days=max_age_days)).isoformat()
+                    query = query.filter(FREDRateCache.as_of >= cutoff)
+                row = query.order_by(FREDRateCache.as_of.desc()).first()
+            else:
+                row = session.get(FREDRateCache, (*key, date.today().isoformat()))
+            return row.rate if row is not None else None
+    except Exception as e:
+        print(f"Warning: FRED rate cache read failed: {str(e)}")
+        return None
+
+
+def _store_rate(key: Tuple[str, int], rate: float) -> None:
+    """
+    Store today's rate for key in the database cache, dropping older days.
+
+    Args:
+        key: (series_id, days)
+        rate: Rate as decimal
+    """
+    try:
+        from src.database.db_config import db_session
+        from src.database.models import FREDRateCache
+
+        series_id, days = key
+        today = date.today().isoformat()
+        with db_session() as session:
+            session.query(FREDRateCache).filter(
+                FREDRateCache.series_id == series_id,
+                FREDRateCache.days == days,
+                FREDRateCache.as_of != today
+            ).delete()
+            session.merge(FREDRateCache(series_id=series_id, days=days, as_of=today, rate=rate))
+    except Exception as e:
+        print(f"Warning: FRED rate cache write failed: {str(e)}")
+
+
+class NoFREDDataError(ValueError):
+    """FRED answered, but the series has no observation in the requested window."""
+
 
 class FREDClient:
     """Client for fetching risk-free rate data from FRED API."""
 
+    # Treasury series by maturity: series i covers maturities up to
+    # _MATURITY_CUTOFFS[i] days (the last one covers everything longer)
+    _MATURITY_CUTOFFS = (30, 90, 180, 365, 365 * 2, 365 * 5, 365 * 10)
+    _MATURITY_SERIES = (
+        'DGS1MO',  # 1-month
+        'DGS3MO',  # 3-month
+        'DGS6MO',  # 6-month
+        'DGS1',    # 1-year
+        'DGS2',    # 2-year
+        'DGS5',    # 5-year
+        'DGS10',   # 10-year
+        'DGS30',   # 30-year
+    )
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize FRED client.
@@ -36,7 +177,44 @@ class FREDClient:
                 "Get a free API key at: https://fred.stlouisfed.org/docs/api/api_key.html"
             )
 
-        self.fred = Fred(api_key=self.api_key)
+    def _get_latest_value(
+        self,
+        series_id: str,
+        observation_start: datetime,
+        observation_end: datetime
+    ) -> float:
+        """
+        Fetch the most recent observation of a FRED series over the shared session.
+
+        Observations are requested newest first and read straight from the
+        JSON, without building a date-indexed Series.
+
+        Args:
+            series_id: FRED series ID
+            observation_start: First observation date
+            observation_end: Last observation date
+
+        Returns:
+            Latest non-missing value in the window (in FRED units)
+        """
+        response = _get_with_retry(FRED_OBSERVATIONS_URL, params={
+            'series_id': series_id,
+            'api_key': self.api_key,
+            'file_type': 'json',
+            'observation_start': observation_start.strftime('%Y-%m-%d'),
+            'observation_end': observation_end.strftime('%Y-%m-%d'),
+            'sort_order': 'desc',
+        })
+        payload = response.json()
+        if response.status_code != 200:
+            raise ValueError(payload.get('error_message', f"HTTP {response.status_code}"))
+
+        # FRED marks missing observations (e.g. holidays) with '.'
+        for obs in payload['observations']:
+            if obs['value'] != '.':
+                return float(obs['value'])
+
+        raise NoFREDDataError(f"No data returned for series {series_id}")
 
     def get_risk_free_rate(
         self,
@@ -57,32 +235,73 @@ class FREDClient:
 
         Returns:
             Risk-free rate as decimal (e.g., 0.05 for 5%)
+
+        Raises:
+            NoFREDDataError: If the window has no observation and no rate was
+                stored in the last STORED_RATE_MAX_AGE_DAYS days
         """
+        key = (series_id, days)
+        cached = _RATE_CACHE.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        # Rates fetched earlier today (possibly by a previous process)
+        rate = _load_stored_rate(key)
+        if rate is not None:
+            with _RATE_CACHE_LOCK:
+                _RATE_CACHE[key] = (rate, time.monotonic() + RATE_CACHE_TTL_SECONDS)
+            return rate
+
         try:
             # Get most recent data
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
 
-            data = self.fred.get_series(
+            # Most recent non-null value
+            rate = self._get_latest_value(
                 series_id,
                 observation_start=start_date,
                 observation_end=end_date
             )
 
-            if data.empty:
-                raise ValueError(f"No data returned for series {series_id}")
-
-            # Get most recent non-null value
-            rate = data.dropna().iloc[-1]
-
             # Convert from percentage to decimal
-            return float(rate) / 100.0
+            rate = rate / 100.0
+
+            # Only real observations are cached, never the fallback below
+            with _RATE_CACHE_LOCK:
+                _RATE_CACHE[key] = (rate, time.monotonic() + RATE_CACHE_TTL_SECONDS)
+            _store_rate(key, rate)
+            return rate
+
+        except NoFREDDataError:
+            # FRED answered but has no observation in the window: not a
+            # transient failure, so never mask it with the default rate
+            rate = _load_stored_rate(key, latest=True, max_age_days=STORED_RATE_MAX_AGE_DAYS)
+            if rate is None:
+                raise
+            print(
+                f"Warning: FRED has no {series_id} observation in the last {days} days, "
+                f"using last stored rate of {rate*100:.2f}%"
+            )
+            return rate
 
-        except Exception as e:
-            # Fallback to default rate if FRED API fails (SSL errors, network issues, etc.)
-            print(f"Warning: FRED API failed ({str(e)}), using default rate of 4.5%")
+        except (requests.RequestException, ValueError, KeyError) as e:
+            # Fall back to the last stored rate (e.g. yesterday's) if FRED API
+            # fails after retries (SSL errors, network issues, error replies,
+            # malformed data), and only to the default rate when there is none
+            rate = _load_stored_rate(key, latest=True)
+            if rate is not None:
+                print(f"Warning: FRED API failed ({str(e)}), using last stored rate of {rate*100:.2f}%")
+                return rate
+            print(f"Error: FRED API failed ({str(e)}), using default rate of 4.5%")
             return 0.045  # Default 4.5% (approximate current 3-month Treasury rate)
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached rates (shared by every FREDClient)."""
+        with _RATE_CACHE_LOCK:
+            _RATE_CACHE.clear()
+
     def get_rate_for_maturity(self, days_to_maturity: int) -> float:
         """
         Get risk-free rate for a specific maturity.
@@ -94,25 +313,27 @@ class FREDClient:
             Risk-free rate as decimal
         """
         # Map maturity to appropriate FRED series
-        if days_to_maturity <= 30:
-            series_id = 'DGS1MO'  # 1-month
-        elif days_to_maturity <= 90:
-            series_id = 'DGS3MO'  # 3-month
-        elif days_to_maturity <= 180:
-            series_id = 'DGS6MO'  # 6-month
-        elif days_to_maturity <= 365:
-            series_id = 'DGS1'    # 1-year
-        elif days_to_maturity <= 365 * 2:
-            series_id = 'DGS2'    # 2-year
-        elif days_to_maturity <= 365 * 5:
-            series_id = 'DGS5'    # 5-year
-        elif days_to_maturity <= 365 * 10:
-            series_id = 'DGS10'   # 10-year
-        else:
-            series_id = 'DGS30'   # 30-year
-
+        series_id = self._MATURITY_SERIES[bisect_left(self._MATURITY_CUTOFFS, days_to_maturity)]
         return self.get_risk_free_rate(series_id=series_id, days=7)
 
+    def get_rates_for_maturities(self, days_to_maturity: np.ndarray) -> np.ndarray:
+        """
+        Get risk-free rates for many maturities, fetching each series once.
+
+        Args:
+            days_to_maturity: Array of days to maturity (e.g. per option contract)
+
+        Returns:
+            Array of risk-free rates as decimals, same shape as the input
+        """
+        idx = np.searchsorted(self._MATURITY_CUTOFFS, days_to_maturity, side='left')
+        used, inverse = np.unique(idx, return_inverse=True)
+        rates = np.array([
+            self.get_risk_free_rate(series_id=self._MATURITY_SERIES[i], days=7)
+            for i in used
+        ], dtype=float)
+        return rates[inverse].reshape(idx.shape)
+
     def get_treasury_curve(self) -> dict:
         """
         Get the entire Treasury yield curve.
@@ -131,14 +352,19 @@ class FREDClient:
             '30Y': 'DGS30'
         }
 
-        curve = {}
-        for maturity, series_id in maturities.items():
-            try:
-                rate = self.get_risk_free_rate(series_id=series_id, days=7)
-                curve[maturity] = rate
-            except Exception as e:
-                print(f"Warning: Failed to fetch {maturity} rate: {str(e)}")
-                curve[maturity] = None
+        # The series are independent, so fetch them all at once
+        curve = dict.fromkeys(maturities)
+        with ThreadPoolExecutor(max_workers=len(maturities)) as pool:
+            futures = {
+                pool.submit(self.get_risk_free_rate, series_id=series_id, days=7): maturity
+                for maturity, series_id in maturities.items()
+            }
+            for future in as_completed(futures):
+                maturity = futures[future]
+                try:
+                    curve[maturity] = future.result()
+                except Exception as e:
+                    print(f"Warning: Failed to fetch {maturity} rate: {str(e)}")
 
         return curve
 
@@ -5,6 +5,7 @@ This is the primary data source for option prices.
 
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from openbb import obb
@@ -106,9 +107,20 @@ class OpenBBClient:
             List of expiration dates (YYYY-MM-DD format)
         """
         try:
-            df = self.get_spy_options(ticker=ticker, min_expiry_days=0, max_expiry_days=365)
-            expirations = df['expiration'].unique()
-            return sorted([str(d) for d in expirations])
+            data = obb.equity.options.chains(
+                symbol=ticker,
+                provider="intrinio"  # Free provider
+            )
+
+            if data is None or len(data) == 0:
+                raise ValueError(f"No option data returned for {ticker}")
+
+            # Only the distinct expirations are needed: no cleaning and no
+            # per-row day counts over the whole chain
+            expirations = data.to_df()['expiration'].unique()
+            days_to_expiry = (pd.to_datetime(expirations) - pd.Timestamp.now()).days
+            in_window = np.asarray((days_to_expiry >= 0) & (days_to_expiry <= 365))
+            return sorted([str(d) for d in expirations[in_window]])
         except Exception as e:
             raise RuntimeError(f"Failed to fetch expirations: {str(e)}")
 
@@ -130,8 +142,11 @@ class OpenBBClient:
         df = self.get_spy_options(ticker=ticker, min_expiry_days=0, max_expiry_days=365)
         df_exp = df[df['expiration'] == expiration_date]
 
-        calls = df_exp[df_exp['optionType'] == 'call'].sort_values('strike')
-        puts = df_exp[df_exp['optionType'] == 'put'].sort_values('strike')
+        # Split calls and puts in one pass over the (categorical) option type
+        by_type = dict(tuple(df_exp.groupby('optionType', observed=True)))
+        empty = df_exp.iloc[:0]
+        calls = by_type.get('call', empty).sort_values('strike')
+        puts = by_type.get('put', empty).sort_values('strike')
 
         return calls, puts
 
@@ -145,44 +160,49 @@ class OpenBBClient:
         Returns:
             Cleaned DataFrame
         """
-        # Remove rows with missing critical data
-        df = df.dropna(subset=['strike', 'lastPrice', 'impliedVolatility'])
-
-        # Remove zero or negative prices
-        df = df[df['lastPrice'] > 0]
-
-        # Remove zero or negative IV
-        df = df[df['impliedVolatility'] > 0]
+        # Keep rows with a strike, a positive price and a positive IV in a
+        # single pass (comparisons with NaN are False, so missing data drops too)
+        mask = df['strike'].notna() & (df['lastPrice'] > 0) & (df['impliedVolatility'] > 0)
+        df = df.loc[mask].copy()
 
         # Calculate mid price from bid-ask if available
         if 'bid' in df.columns and 'ask' in df.columns:
             df['midPrice'] = (df['bid'] + df['ask']) / 2
             # Use mid price if available and reasonable
-            df['price'] = df.apply(
-                lambda row: row['midPrice']
-                if pd.notna(row['midPrice']) and row['midPrice'] > 0
-                else row['lastPrice'],
-                axis=1
-            )
+            valid_mid = df['midPrice'].notna() & (df['midPrice'] > 0)
+            df['price'] = np.where(valid_mid, df['midPrice'], df['lastPrice'])
         else:
             df['price'] = df['lastPrice']
 
+        # Compact dtypes: counts as int32 (when none are missing) and the option
+        # type as a categorical. Strikes and prices stay float64 - the PDF is
+        # their second derivative, which float32 rounding would swamp.
+        for column in ('volume', 'openInterest'):
+            if column in df.columns and df[column].notna().all():
+                df[column] = df[column].astype(np.int32)
+        if 'optionType' in df.columns:
+            df['optionType'] = df['optionType'].astype('category')
+
         # Sort by strike
         df = df.sort_values(['expiration', 'strike'])
 
         return df
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> OpenBBClient:
+    """Shared client for the convenience functions, created on first use."""
+    return OpenBBClient()
+
+
 def get_spy_options(*args, **kwargs) -> pd.DataFrame:
     """Convenience function to fetch SPY options."""
-    client = OpenBBClient()
-    return client.get_spy_options(*args, **kwargs)
+    return _get_client().get_spy_options(*args, **kwargs)
 
 
 def get_spot_price(ticker: str = "SPY") -> float:
     """Convenience function to get spot price."""
-    client = OpenBBClient()
-    return client.get_spot_price(ticker)
+    return _get_client().get_spot_price(ticker)
 
 
 if __name__ == "__main__":
@@ -3,19 +3,107 @@ YFinance client for fetching SPY/SPX option chain data.
 This is a backup data source when OpenBB is unavailable.
 """
 
-from typing import Optional, List, Tuple
+import time
+import threading
+import importlib.util
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pandas as pd
 import numpy as np
+import requests
 import yfinance as yf
 
+# One keep-alive HTTP session shared by every Ticker, so requests after the
+# first skip the TCP + TLS handshake. Only needed for older yfinance
+# releases: newer ones run on curl_cffi, already share a process-wide
+# session and reject plain requests sessions.
+if importlib.util.find_spec('curl_cffi') is None:
+    _SESSION = requests.Session()
+    _SESSION.headers.update({'User-Agent': 'Mozilla/5.0'})
+else:
+    _SESSION = None
+
+# Upper bound on concurrent option-chain requests to Yahoo
+MAX_CHAIN_WORKERS = 8
+
+# yf.Ticker memoizes quotes and expirations internally, so reused Ticker
+# objects are replaced after this many seconds to keep data fresh
+TICKER_TTL_SECONDS = 60
+
+# Expiration lists and option chains are reused for this long, which absorbs
+# repeated UI requests (e.g. switching tabs) without going back to Yahoo
+CHAIN_CACHE_TTL_SECONDS = 60
+CHAIN_CACHE_SIZE = 64
+
 
 class YFinanceClient:
     """Client for fetching option data from Yahoo Finance."""
 
     def __init__(self):
         """Initialize YFinance client."""
-        pass
+        # Reused yf.Ticker objects: ticker -> (Ticker, expiry on the monotonic clock)
+        self._ticker_cache: Dict[str, Tuple[yf.Ticker, float]] = {}
+        self._ticker_lock = threading.Lock()
+
+        # Expiration lists and option chains: (ticker, expiration or None) -> (value, expiry)
+        self._chain_cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[Any, float]]" = OrderedDict()
+        self._chain_lock = threading.Lock()
+
+    def _get_ticker(self, ticker: str) -> yf.Ticker:
+        """
+        Get a yf.Ticker for ticker, reusing a recent one.
+
+        Args:
+            ticker: Ticker symbol
+
+        Returns:
+            yfinance Ticker
+        """
+        now = time.monotonic()
+        with self._ticker_lock:
+            cached = self._ticker_cache.get(ticker)
+            if cached is not None and now < cached[1]:
+                return cached[0]
+            stock = yf.Ticker(ticker, session=_SESSION)
+            self._ticker_cache[ticker] = (stock, now + TICKER_TTL_SECONDS)
+            return stock
+
+    def _cached(self, key: Tuple[str, Optional[str]], fetch: Callable[[], Any]) -> Any:
+        """
+        Return a recent result for key, or fetch and remember it.
+
+        Args:
+            key: (ticker, expiration date or None for the expiration list)
+            fetch: Zero-argument function doing the Yahoo request
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        now = time.monotonic()
+        with self._chain_lock:
+            cached = self._chain_cache.get(key)
+            if cached is not None and now < cached[1]:
+                self._chain_cache.move_to_end(key)
+                return cached[0]
+
+        value = fetch()
+        with self._chain_lock:
+            self._chain_cache[key] = (value, time.monotonic() + CHAIN_CACHE_TTL_SECONDS)
+            self._chain_cache.move_to_end(key)
+            while len(self._chain_cache) > CHAIN_CACHE_SIZE:
+                self._chain_cache.popitem(last=False)
+        return value
+
+    def _get_expirations(self, ticker: str) -> Tuple[str, ...]:
+        """Get the option expiration dates for ticker (cached briefly)."""
+        return self._cached((ticker, None), lambda: tuple(self._get_ticker(ticker).options))
+
+    def _get_option_chain(self, ticker: str, exp_date: str):
+        """Get the raw yfinance option chain for one expiration (cached briefly)."""
+        return self._cached((ticker, exp_date), lambda: self._get_ticker(ticker).option_chain(exp_date))
 
     def get_spy_options(
         self,
@@ -44,11 +132,8 @@ class YFinanceClient:
                 - impliedVolatility: Implied volatility
         """
         try:
-            # Create ticker object
-            stock = yf.Ticker(ticker)
-
             # Get all expiration dates
-            expirations = stock.options
+            expirations = self._get_expirations(ticker)
 
             if not expirations:
                 raise ValueError(f"No option data available for {ticker}")
@@ -58,7 +143,7 @@ class YFinanceClient:
             valid_expirations = []
 
             for exp_str in expirations:
-                exp_date = datetime.strptime(exp_str, '%Y-%m-%d')
+                exp_date = datetime.fromisoformat(exp_str)
                 days_to_exp = (exp_date - today).days
 
                 if min_expiry_days <= days_to_exp <= max_expiry_days:
@@ -69,30 +154,11 @@ class YFinanceClient:
                     f"No expirations found between {min_expiry_days} and {max_expiry_days} days"
                 )
 
-            # Fetch option chains for valid expirations
-            all_options = []
-
-            for exp_date in valid_expirations:
-                try:
-                    # Get option chain
-                    opt_chain = stock.option_chain(exp_date)
-
-                    # Process calls
-                    calls = opt_chain.calls.copy()
-                    calls['optionType'] = 'call'
-                    calls['expiration'] = exp_date
-
-                    # Process puts
-                    puts = opt_chain.puts.copy()
-                    puts['optionType'] = 'put'
-                    puts['expiration'] = exp_date
-
-                    # Combine
-                    all_options.extend([calls, puts])
-
-                except Exception as e:
-                    print(f"Warning: Failed to fetch options for {exp_date}: {str(e)}")
-                    continue
+            # Fetch option chains for valid expirations concurrently
+            # (one independent request each; results keep expiration order)
+            with ThreadPoolExecutor(max_workers=min(MAX_CHAIN_WORKERS, len(valid_expirations))) as pool:
+                chains = pool.map(lambda exp_date: self._fetch_chain(ticker, exp_date), valid_expirations)
+                all_options = [frame for chain in chains for frame in chain]
 
             if not all_options:
                 raise ValueError("Failed to fetch any option data")
@@ -104,9 +170,7 @@ class YFinanceClient:
             df = self._standardize_columns(df)
 
             # Calculate days to expiry
-            df['days_to_expiry'] = df['expiration'].apply(
-                lambda x: (datetime.strptime(x, '%Y-%m-%d') - today).days
-            )
+            df['days_to_expiry'] = (pd.to_datetime(df['expiration']) - pd.Timestamp(today)).dt.days
 
             # Clean data
             df = self._clean_option_data(df)
@@ -116,6 +180,32 @@ class YFinanceClient:
         except Exception as e:
             raise RuntimeError(f"Failed to fetch option data from YFinance: {str(e)}")
 
+    def _fetch_chain(self, ticker: str, exp_date: str) -> List[pd.DataFrame]:
+        """
+        Fetch calls and puts for one expiration, tagged with type and date.
+
+        Args:
+            ticker: Ticker symbol
+            exp_date: Expiration date (YYYY-MM-DD)
+
+        Returns:
+            [calls, puts], or an empty list if the request failed
+        """
+        try:
+            # Get option chain
+            opt_chain = self._get_option_chain(ticker, exp_date)
+
+            # Tag calls and puts (assign returns new frames, leaving the
+            # cached chain untouched)
+            calls = opt_chain.calls.assign(optionType='call', expiration=exp_date)
+            puts = opt_chain.puts.assign(optionType='put', expiration=exp_date)
+
+            return [calls, puts]
+
+        except Exception as e:
+            print(f"Warning: Failed to fetch options for {exp_date}: {str(e)}")
+            return []
+
     def get_spot_price(self, ticker: str = "SPY") -> float:
         """
         Get current spot price for the underlying.
@@ -127,13 +217,13 @@ class YFinanceClient:
             Current price
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = self._get_ticker(ticker)
             info = stock.info
             return float(info.get('currentPrice', info.get('regularMarketPrice', 0)))
         except Exception as e:
             # Fallback: get from recent history
             try:
-                stock = yf.Ticker(ticker)
+                stock = self._get_ticker(ticker)
                 hist = stock.history(period='1d')
                 return float(hist['Close'].iloc[-1])
             except:
@@ -150,8 +240,7 @@ class YFinanceClient:
             List of expiration dates (YYYY-MM-DD format)
         """
         try:
-            stock = yf.Ticker(ticker)
-            return list(stock.options)
+            return list(self._get_expirations(ticker))
         except Exception as e:
             raise RuntimeError(f"Failed to fetch expirations: {str(e)}")
 
@@ -171,18 +260,14 @@ class YFinanceClient:
             Tuple of (calls_df, puts_df)
         """
         try:
-            stock = yf.Ticker(ticker)
-            opt_chain = stock.option_chain(expiration_date)
+            opt_chain = self._get_option_chain(ticker, expiration_date)
 
-            calls = opt_chain.calls.copy()
-            calls = self._standardize_columns(calls)
-            calls['expiration'] = expiration_date
-            calls['optionType'] = 'call'
-
-            puts = opt_chain.puts.copy()
-            puts = self._standardize_columns(puts)
-            puts['expiration'] = expiration_date
-            puts['optionType'] = 'put'
+            calls = self._standardize_columns(opt_chain.calls).assign(
+                expiration=expiration_date, optionType='call'
+            )
+            puts = self._standardize_columns(opt_chain.puts).assign(
+                expiration=expiration_date, optionType='put'
+            )
 
             return calls, puts
 
@@ -225,51 +310,60 @@ class YFinanceClient:
         Returns:
             Cleaned DataFrame
         """
-        # Remove rows with missing critical data
-        df = df.dropna(subset=['strike', 'lastPrice'])
-
-        # Remove zero or negative prices
-        df = df[df['lastPrice'] > 0]
+        # Rows with a strike and a positive price (comparisons with NaN are
+        # False, so missing prices drop too); filtered once, at the end
+        mask = df['strike'].notna() & (df['lastPrice'] > 0)
 
         # For IV, be more lenient - fill with reasonable defaults if missing
         if 'impliedVolatility' not in df.columns:
+            df = df.loc[mask].copy()
             df['impliedVolatility'] = 0.20  # Default 20% IV
         else:
             # Fill missing IVs with mean of available IVs
-            df['impliedVolatility'] = df['impliedVolatility'].fillna(df['impliedVolatility'].mean())
-            # Remove rows with still invalid IVs
-            df = df[df['impliedVolatility'] > 0]
-            df = df[df['impliedVolatility'] < 5.0]  # Remove unrealistic IVs > 500%
+            iv = df['impliedVolatility'].fillna(df.loc[mask, 'impliedVolatility'].mean())
+            # Remove rows with still invalid IVs, and unrealistic IVs > 500%
+            mask &= (iv > 0) & (iv < 5.0)
+            df = df.loc[mask].copy()
+            df['impliedVolatility'] = iv[mask]
 
         # Calculate mid price from bid-ask if available
         if 'bid' in df.columns and 'ask' in df.columns:
             df['midPrice'] = (df['bid'] + df['ask']) / 2
             # Use mid price if available and reasonable
-            df['price'] = df.apply(
-                lambda row: row['midPrice']
-                if pd.notna(row['midPrice']) and row['midPrice'] > 0
-                else row['lastPrice'],
-                axis=1
-            )
+            valid_mid = df['midPrice'].notna() & (df['midPrice'] > 0)
+            df['price'] = np.where(valid_mid, df['midPrice'], df['lastPrice'])
         else:
             df['price'] = df['lastPrice']
 
+        # Compact dtypes: counts as int32 (when none are missing) and the option
+        # type as a categorical. Strikes and prices stay float64 - the PDF is
+        # their second derivative, which float32 rounding would swamp.
+        for column in ('volume', 'openInterest'):
+            if column in df.columns and df[column].notna().all():
+                df[column] = df[column].astype(np.int32)
+        if 'optionType' in df.columns:
+            df['optionType'] = df['optionType'].astype('category')
+
         # Sort by strike
         df = df.sort_values(['expiration', 'strike'])
 
         return df
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> YFinanceClient:
+    """Shared client for the convenience functions, created on first use."""
+    return YFinanceClient()
+
+
 def get_spy_options(*args, **kwargs) -> pd.DataFrame:
     """Convenience function to fetch SPY options."""
-    client = YFinanceClient()
-    return client.get_spy_options(*args, **kwargs)
+    return _get_client().get_spy_options(*args, **kwargs)
 
 
 def get_spot_price(ticker: str = "SPY") -> float:
     """Convenience function to get spot price."""
-    client = YFinanceClient()
-    return client.get_spot_price(ticker)
+    return _get_client().get_spot_price(ticker)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 Database layer for PDF storage and retrieval.
 """
 
-from .models import PDFSnapshot, Prediction, PatternMatch
+from .models import PDFSnapshot, Prediction, PatternMatch, FREDRateCache
 from .db_config import DatabaseManager, get_db_session, db_session
 from .pdf_archive import PDFArchive
 
@@ -10,6 +10,7 @@ __all__ = [
     'PDFSnapshot',
     'Prediction',
     'PatternMatch',
+    'FREDRateCache',
     'DatabaseManager',
     'get_db_session',
     'db_session',
@@ -3,15 +3,19 @@ Database configuration and session management.
 """
 
 import os
+import threading
 from pathlib import Path
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect, text, func, and_, or_
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 
-from .models import Base
+from .models import Base, PDFSnapshot, _PICKLE_PROTO, _PICKLE_STOP
+
+# Serializes creation and first initialization of the DatabaseManager
+# singleton; FRED rate lookups reach it from several threads at once
+_INIT_LOCK = threading.Lock()
 
 
 class DatabaseManager:
@@ -25,10 +29,11 @@ class DatabaseManager:
     _engine = None
     _session_factory = None
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def __new__(cls, *args, **kwargs):
+        with _INIT_LOCK:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
 
     def __init__(self, db_path: str = None, echo: bool = False):
         """
@@ -38,29 +43,40 @@ class DatabaseManager:
             db_path: Path to SQLite database file. If None, uses default from config.
             echo: If True, SQL statements are logged (useful for debugging)
         """
-        if self._engine is None:
-            if db_path is None:
-                # Use default path from project root
-                project_root = Path(__file__).parent.parent.parent
-                db_dir = project_root / 'data'
-                db_dir.mkdir(exist_ok=True)
-                db_path = str(db_dir / 'pdf_visualizer.db')
-
-            # Create engine
-            self._engine = self._create_engine(db_path, echo)
-
-            # Enable foreign keys for SQLite
-            @event.listens_for(self._engine, "connect")
-            def set_sqlite_pragma(dbapi_conn, connection_record):
-                cursor = dbapi_conn.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.close()
-
-            # Create session factory
-            self._session_factory = sessionmaker(bind=self._engine)
-
-            # Create all tables
-            self.create_tables()
+        with _INIT_LOCK:
+            if self._engine is None:
+                if db_path is None:
+                    # Use default path from project root
+                    project_root = Path(__file__).parent.parent.parent
+                    db_dir = project_root / 'data'
+                    db_dir.mkdir(exist_ok=True)
+                    db_path = str(db_dir / 'pdf_visualizer.db')
+
+                # Create engine
+                self._engine = self._create_engine(db_path, echo)
+
+                # Enable foreign keys for SQLite, plus WAL journaling so readers
+                # run alongside a writer, and a larger in-memory page cache
+                @event.listens_for(self._engine, "connect")
+                def set_sqlite_pragma(dbapi_conn, connection_record):
+                    cursor = dbapi_conn.cursor()
+                    cursor.execute("PRAGMA foreign_keys=ON")
+                    cursor.execute("PRAGMA journal_mode=WAL")
+                    cursor.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL
+                    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB
+                    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+                    cursor.execute("PRAGMA temp_store=MEMORY")
+                    cursor.close()
+
+                # Create session factory; objects stay readable after the scope
+                # commits, since archive methods return them to callers
+                self._session_factory = sessionmaker(
+                    bind=self._engine,
+                    expire_on_commit=False
+                )
+
+                # Create all tables
+                self.create_tables()
 
     @staticmethod
     def _create_engine(db_path: str, echo: bool = False):
@@ -78,12 +94,12 @@ class DatabaseManager:
         database_url = f"sqlite:///{db_path}"
 
         # Create engine
-        # Use StaticPool for SQLite to avoid threading issues
+        # Pooled connections (one per concurrent thread) instead of a single
+        # shared one; WAL mode (see __init__) lets them read concurrently
         engine = create_engine(
             database_url,
             echo=echo,
-            connect_args={'check_same_thread': False},
-            poolclass=StaticPool
+            connect_args={'check_same_thread': False}
         )
 
         return engine
@@ -92,6 +108,57 @@ class DatabaseManager:
         """Create all tables in the database."""
         Base.metadata.create_all(self._engine)
 
+        # create_all() skips tables that already exist, so generated columns
+        # and indexes added to the models later are created here for older
+        # database files (SQLite can only add virtual generated columns)
+        inspector = inspect(self._engine)
+        with self._engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {c['name'] for c in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.computed is None or column.name in existing:
+                        continue
+                    conn.execute(text(
+                        f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+                        f"{column.type.compile(dialect=self._engine.dialect)} "
+                        f"GENERATED ALWAYS AS ({column.computed.sqltext}) VIRTUAL"
+                    ))
+
+            # Superseded by idx_ticker_ts_dte, of which it is a strict prefix
+            conn.execute(text("DROP INDEX IF EXISTS idx_ticker_timestamp"))
+
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self._engine, checkfirst=True)
+
+        self._reencode_pickled_arrays()
+
+    def _reencode_pickled_arrays(self):
+        """
+        Rewrite snapshot arrays still stored as pickles in the raw float32 format.
+
+        Rows written before the switch away from pickle would otherwise be
+        unpickled on every read. Only blobs framed like a pickle stream are
+        selected, so once converted this is a single query returning no rows.
+        """
+        def pickled(column):
+            return and_(
+                func.substr(column, 1, 1) == _PICKLE_PROTO,
+                func.substr(column, -1, 1) == _PICKLE_STOP
+            )
+
+        with self.session_scope() as session:
+            legacy = session.query(PDFSnapshot).filter(
+                or_(pickled(PDFSnapshot.strikes), pickled(PDFSnapshot.pdf_values))
+            ).all()
+
+            for snapshot in legacy:
+                snapshot.set_strikes(snapshot.get_strikes())
+                snapshot.set_pdf_values(snapshot.get_pdf_values())
+
+        if legacy:
+            print(f"✅ Re-encoded arrays of {len(legacy)} snapshots stored with pickle")
+
     def drop_tables(self):
         """Drop all tables (use with caution!)."""
         Base.metadata.drop_all(self._engine)
@@ -8,14 +8,42 @@ Provides a unified interface for:
 - Prediction tracking
 """
 
+import atexit
+import copy
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 import numpy as np
 
 from .db_config import DatabaseManager
 from .pdf_archive import PDFArchive
 from .vector_store import PDFVectorStore, HybridPatternMatcher
 
+# Vector store writes are buffered and sent as one collection.add() call
+VECTOR_BUFFER_SIZE = 100
+
+# Snapshot dicts served to app reruns; snapshots never change once stored,
+# "latest" lookups go stale when a new snapshot arrives elsewhere
+SNAPSHOT_CACHE_SIZE = 256
+LATEST_CACHE_TTL_SECONDS = 60
+
+
+def _copy_snapshot_dict(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a snapshot dict so callers cannot modify a cached entry.
+
+    The nested statistics and SABR dicts are copied too; the strike and PDF
+    arrays are read-only and shared.
+    """
+    snapshot = dict(snapshot)
+    snapshot['statistics'] = copy.deepcopy(snapshot['statistics'])
+    snapshot['sabr_params'] = dict(snapshot['sabr_params'])
+    return snapshot
+
 
 class HistoryAPI:
     """
@@ -52,6 +80,66 @@ class HistoryAPI:
             self.vector_store = None
             self.hybrid_matcher = None
 
+        # Pending vector store writes, flushed in batches (see flush())
+        self._vec_buffer: List[Dict[str, Any]] = []
+        self._vec_buffer_max = VECTOR_BUFFER_SIZE
+        self._vec_lock = threading.Lock()
+
+        # Batches are written on one background thread, in submission order;
+        # _vec_future is the most recent one, awaited before vector reads
+        self._vec_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='vector-writes')
+        self._vec_future: Optional[Future] = None
+        atexit.register(self.flush)
+
+        # Snapshot dicts: ('id', snapshot_id) or ('latest', ticker, dte) -> (dict, expiry)
+        self._snapshot_cache: "OrderedDict[Tuple, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._snapshot_lock = threading.Lock()
+
+    def _cached(
+        self,
+        key: Tuple,
+        fetch: Callable[[], Optional[Dict[str, Any]]],
+        ttl: float = math.inf
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return a cached snapshot dict for key, or fetch and remember it.
+
+        Args:
+            key: Cache key (see __init__)
+            fetch: Zero-argument function returning the dict or None
+            ttl: Seconds the entry stays valid
+
+        Returns:
+            Copy of the snapshot dict (see _copy_snapshot_dict), or None
+            if not found
+        """
+        now = time.monotonic()
+        with self._snapshot_lock:
+            cached = self._snapshot_cache.get(key)
+            if cached is not None and now < cached[1]:
+                self._snapshot_cache.move_to_end(key)
+                return _copy_snapshot_dict(cached[0])
+
+        value = fetch()
+        if value is None:
+            return None
+        with self._snapshot_lock:
+            # The fetched dict itself is only ever held by the cache
+            self._snapshot_cache[key] = (value, time.monotonic() + ttl)
+            self._snapshot_cache.move_to_end(key)
+            while len(self._snapshot_cache) > SNAPSHOT_CACHE_SIZE:
+                self._snapshot_cache.popitem(last=False)
+        return _copy_snapshot_dict(value)
+
+    def _invalidate_cache(self, latest_only: bool = False):
+        """Drop cached snapshot dicts (only 'latest' lookups if latest_only)."""
+        with self._snapshot_lock:
+            if not latest_only:
+                self._snapshot_cache.clear()
+                return
+            for key in [k for k in self._snapshot_cache if k[0] == 'latest']:
+                del self._snapshot_cache[key]
+
     # ========================================================================
     # PDF Snapshot Operations
     # ========================================================================
@@ -111,8 +199,9 @@ class HistoryAPI:
             interpretation_mode=interpretation_mode,
             model_used=model_used
         )
+        self._invalidate_cache(latest_only=True)
 
-        # Store in ChromaDB for fast similarity search
+        # Queue for ChromaDB (fast similarity search); written in batches
         if store_in_vector_db and self.vector_store:
             metadata = {
                 'ticker': ticker,
@@ -121,15 +210,59 @@ class HistoryAPI:
                 'dte': days_to_expiry,
                 **statistics
             }
-            self.vector_store.add_snapshot(
-                snapshot_id=snapshot.id,
-                pdf=pdf_values,
-                strikes=strikes,
-                metadata=metadata
-            )
+            with self._vec_lock:
+                self._vec_buffer.append({
+                    'id': snapshot.id,
+                    'pdf': pdf_values,
+                    'strikes': strikes,
+                    'metadata': metadata
+                })
+                buffer_full = len(self._vec_buffer) >= self._vec_buffer_max
+
+            if buffer_full:
+                self._submit_vec_buffer()
 
         return snapshot.id
 
+    def _write_vec_batch(self, batch: List[Dict[str, Any]]):
+        """Add one batch to the vector store (runs on the writer thread)."""
+        try:
+            self.vector_store.add_snapshots_batch(batch)
+        except Exception as e:
+            print(f"Warning: Failed to add {len(batch)} snapshots to vector store: {e}")
+
+    def _submit_vec_buffer(self):
+        """Hand the buffered snapshots to the background writer."""
+        with self._vec_lock:
+            pending, self._vec_buffer = self._vec_buffer, []
+            if not pending or not self.vector_store:
+                return
+            try:
+                self._vec_future = self._vec_executor.submit(self._write_vec_batch, pending)
+                return
+            except RuntimeError:
+                # Executor already shut down (interpreter exit): write inline
+                pass
+        self._write_vec_batch(pending)
+
+    def _wait_for_vec_writes(self):
+        """Block until every submitted vector store write has finished."""
+        future = self._vec_future
+        if future is not None:
+            future.result()
+
+    def flush(self):
+        """
+        Write buffered snapshots to the vector store and wait for them.
+
+        Vector writes from save_pdf_analysis() are batched and run on a
+        background thread; searches and stats flush first, and the buffer is
+        also flushed at interpreter exit. Call this directly when the vector
+        store must be up to date.
+        """
+        self._submit_vec_buffer()
+        self._wait_for_vec_writes()
+
     def get_pdf_snapshot(self, snapshot_id: int) -> Optional[Dict[str, Any]]:
         """
         Retrieve a PDF snapshot by ID.
@@ -140,8 +273,11 @@ class HistoryAPI:
         Returns:
             Dictionary with snapshot data or None
         """
-        snapshot = self.archive.get_snapshot_by_id(snapshot_id)
-        return snapshot.to_dict() if snapshot else None
+        def fetch():
+            snapshot = self.archive.get_snapshot_by_id(snapshot_id)
+            return snapshot.to_dict() if snapshot else None
+
+        return self._cached(('id', snapshot_id), fetch)
 
     def get_latest_pdf(
         self,
@@ -158,8 +294,13 @@ class HistoryAPI:
         Returns:
             Dictionary with snapshot data or None
         """
-        snapshot = self.archive.get_latest_snapshot(ticker, days_to_expiry)
-        return snapshot.to_dict() if snapshot else None
+        def fetch():
+            snapshot = self.archive.get_latest_snapshot(ticker, days_to_expiry)
+            return snapshot.to_dict() if snapshot else None
+
+        return self._cached(
+            ('latest', ticker, days_to_expiry), fetch, ttl=LATEST_CACHE_TTL_SECONDS
+        )
 
     def get_pdf_history(
         self,
@@ -202,7 +343,8 @@ class HistoryAPI:
         ticker: str = 'SPY',
         n_results: int = 10,
         min_similarity: float = 0.7,
-        days_to_expiry_range: Tuple[int, int] = (20, 40)
+        days_to_expiry_range: Tuple[int, int] = (20, 40),
+        implied_move_tolerance: float = None
     ) -> List[Dict[str, Any]]:
         """
         Find historically similar PDF patterns.
@@ -218,12 +360,16 @@ class HistoryAPI:
             n_results: Number of results to return
             min_similarity: Minimum similarity threshold
             days_to_expiry_range: Filter by DTE range
+            implied_move_tolerance: In the database-only search, only load
+                snapshots whose implied move is within this many percentage
+                points of the current one (optional)
 
         Returns:
             List of similar patterns with similarity scores
         """
         if self.hybrid_matcher:
             # Use hybrid approach (fast)
+            self.flush()
             matches = self.hybrid_matcher.find_similar_patterns(
                 current_pdf=current_pdf,
                 current_strikes=current_strikes,
@@ -237,10 +383,21 @@ class HistoryAPI:
             # Fallback to database-only (slower but works)
             from src.core.patterns import PDFPatternMatcher
 
+            # Rejected in SQL on the indexed implied move column, so their
+            # arrays and statistics are never loaded
+            implied_move_range = None
+            current_move = current_stats.get('implied_move_pct')
+            if implied_move_tolerance is not None and current_move is not None:
+                implied_move_range = (
+                    current_move - implied_move_tolerance,
+                    current_move + implied_move_tolerance
+                )
+
             historical_data = self.archive.get_snapshots_for_pattern_matching(
                 ticker=ticker,
                 max_snapshots=100,
-                days_to_expiry_range=days_to_expiry_range
+                days_to_expiry_range=days_to_expiry_range,
+                implied_move_range=implied_move_range
             )
 
             matcher = PDFPatternMatcher(
@@ -390,6 +547,7 @@ class HistoryAPI:
         db_stats = self.archive.get_database_stats()
 
         if self.vector_store:
+            self.flush()
             db_stats['vector_store_count'] = self.vector_store.get_count()
 
         return db_stats
@@ -407,8 +565,12 @@ class HistoryAPI:
         # Clear SQLite
         self.db_manager.drop_tables()
         self.db_manager.create_tables()
+        self._invalidate_cache()
 
-        # Clear ChromaDB
+        # Clear ChromaDB, dropping writes that have not been flushed yet
+        with self._vec_lock:
+            self._vec_buffer = []
+        self._wait_for_vec_writes()
         if self.vector_store:
             self.vector_store.clear()
 
@@ -422,9 +584,14 @@ class HistoryAPI:
             snapshot_id: Snapshot ID
 
         Returns:
-            Complete snapshot data as dictionary
+            Complete snapshot data as dictionary, with strikes and PDF values
+            as lists so it can be passed to json.dump (None if not found)
         """
-        return self.get_pdf_snapshot(snapshot_id)
+        snapshot = self.get_pdf_snapshot(snapshot_id)
+        if snapshot is not None:
+            snapshot['strikes'] = snapshot['strikes'].tolist()
+            snapshot['pdf_values'] = snapshot['pdf_values'].tolist()
+        return snapshot
 
 
 # Convenience singleton for global access
@@ -5,18 +5,95 @@ SQLAlchemy models for PDF storage and prediction tracking.
 from datetime import datetime
 from typing import Dict, Any, List
 import json
+import math
 import pickle
 import numpy as np
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson is optional - the stdlib json module is used instead
+    ORJSON_AVAILABLE = False
 
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, Boolean,
-    Text, LargeBinary, ForeignKey, Index
+    Text, LargeBinary, ForeignKey, Index, Computed
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
+# Pickle protocol 2+ streams open with PROTO (0x80) and close with STOP ('.')
+_PICKLE_PROTO = b'\x80'
+_PICKLE_STOP = b'.'
+
+
+def _encode_array(values: np.ndarray) -> bytes:
+    """Serialize an array as raw little-endian float32 bytes."""
+    return np.ascontiguousarray(values, dtype='<f4').tobytes()
+
+
+def _decode_array(blob: bytes) -> np.ndarray:
+    """
+    Deserialize an array stored by _encode_array.
+
+    Rows written before the switch to raw float32 hold pickled arrays.
+    DatabaseManager.create_tables re-encodes those at startup; until then
+    they are still read here.
+
+    Args:
+        blob: Column contents
+
+    Returns:
+        Read-only float32 array (or the legacy pickled array)
+    """
+    if blob[:1] == _PICKLE_PROTO and blob[-1:] == _PICKLE_STOP:
+        try:
+            legacy = pickle.loads(blob)
+        except Exception:
+            legacy = None
+        if isinstance(legacy, np.ndarray):
+            legacy.setflags(write=False)
+            return legacy
+    return np.frombuffer(blob, dtype='<f4')
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps hook for the NumPy scalars and arrays found in stats dicts."""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _has_non_finite(value: Any) -> bool:
+    """True if value (or anything nested in it) is a NaN or infinite float."""
+    if isinstance(value, (float, np.floating)):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind == 'f' and not np.isfinite(value).all()
+    return False
+
+
+def _statistic_column(key: str) -> Column:
+    """
+    Generated column exposing one key of the statistics JSON to SQL.
+
+    Virtual (computed on read, materialized only in indexes) so it can be
+    added to existing tables. json.dumps writes non-finite floats as NaN or
+    Infinity, which SQLite's JSON functions reject, so those tokens are read
+    as null; the column is NULL when the key is missing or not finite.
+    """
+    doc = "replace(replace(replace(statistics, '-Infinity', 'null'), 'Infinity', 'null'), 'NaN', 'null')"
+    return Column(Float, Computed(
+        f"CASE WHEN json_valid({doc}) THEN json_extract({doc}, '$.{key}') END",
+        persisted=False
+    ))
+
 
 class PDFSnapshot(Base):
     """
@@ -43,8 +120,8 @@ class PDFSnapshot(Base):
     risk_free_rate = Column(Float, nullable=False)
 
     # PDF data (stored as binary)
-    strikes = Column(LargeBinary, nullable=False)  # NumPy array pickled
-    pdf_values = Column(LargeBinary, nullable=False)  # NumPy array pickled
+    strikes = Column(LargeBinary, nullable=False)  # Raw float32 bytes
+    pdf_values = Column(LargeBinary, nullable=False)  # Raw float32 bytes
 
     # SABR parameters (if used)
     sabr_alpha = Column(Float, nullable=True)
@@ -56,6 +133,12 @@ class PDFSnapshot(Base):
     # Statistics (stored as JSON)
     statistics = Column(Text, nullable=False)  # JSON string
 
+    # Frequently filtered statistics, extracted from the JSON by SQLite
+    mean_stat = _statistic_column('mean')
+    std_stat = _statistic_column('std')
+    skewness_stat = _statistic_column('skewness')
+    implied_move_pct_stat = _statistic_column('implied_move_pct')
+
     # AI interpretation
     interpretation = Column(Text, nullable=True)
     interpretation_mode = Column(String(20), nullable=True)  # 'standard', 'conservative', etc.
@@ -67,41 +150,84 @@ class PDFSnapshot(Base):
                                   back_populates='current_snapshot')
     predictions = relationship('Prediction', back_populates='snapshot')
 
-    # Indexes for common queries
+    # Indexes for common queries; days_to_expiry rides along in the
+    # timestamp index so date-range queries filter on DTE without row lookups
     __table_args__ = (
-        Index('idx_ticker_timestamp', 'ticker', 'timestamp'),
+        Index('idx_ticker_ts_dte', 'ticker', 'timestamp', 'days_to_expiry'),
         Index('idx_ticker_expiry', 'ticker', 'days_to_expiry'),
+        Index('idx_ticker_implied_move', 'ticker', 'implied_move_pct_stat'),
     )
 
     def __repr__(self):
         return f"<PDFSnapshot(id={self.id}, ticker={self.ticker}, timestamp={self.timestamp}, dte={self.days_to_expiry})>"
 
+    def _decoded(self, column: str) -> np.ndarray:
+        """
+        Decode a binary array column, memoized on the instance.
+
+        The memo is keyed by the blob object itself, so assigning a new value
+        to the column (directly or through a setter) invalidates it.
+        """
+        blob = getattr(self, column)
+        memo = self.__dict__.get('_decoded_' + column)
+        if memo is None or memo[0] is not blob:
+            memo = (blob, _decode_array(blob))
+            self.__dict__['_decoded_' + column] = memo
+        return memo[1]
+
+    @property
+    def _strikes_arr(self) -> np.ndarray:
+        return self._decoded('strikes')
+
+    @property
+    def _pdf_arr(self) -> np.ndarray:
+        return self._decoded('pdf_values')
+
     def get_strikes(self) -> np.ndarray:
         """Deserialize strikes from binary."""
-        return pickle.loads(self.strikes)
+        return self._strikes_arr
 
     def set_strikes(self, strikes: np.ndarray):
         """Serialize strikes to binary."""
-        self.strikes = pickle.dumps(strikes)
+        self.strikes = _encode_array(strikes)
 
     def get_pdf_values(self) -> np.ndarray:
         """Deserialize PDF values from binary."""
-        return pickle.loads(self.pdf_values)
+        return self._pdf_arr
 
     def set_pdf_values(self, pdf_values: np.ndarray):
         """Serialize PDF values to binary."""
-        self.pdf_values = pickle.dumps(pdf_values)
+        self.pdf_values = _encode_array(pdf_values)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Deserialize statistics from JSON."""
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(self.statistics)
+            except orjson.JSONDecodeError:
+                # NaN/Infinity tokens are only understood by the json module
+                pass
         return json.loads(self.statistics)
 
     def set_statistics(self, stats: Dict[str, Any]):
-        """Serialize statistics to JSON."""
-        self.statistics = json.dumps(stats)
+        """
+        Serialize statistics to JSON.
+
+        NumPy scalars are accepted. Non-finite values are written as NaN or
+        Infinity so they read back unchanged (orjson would write null).
+        """
+        if ORJSON_AVAILABLE and not _has_non_finite(stats):
+            self.statistics = orjson.dumps(stats, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        else:
+            self.statistics = json.dumps(stats, default=_json_default)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert snapshot to dictionary."""
+        """
+        Convert snapshot to dictionary.
+
+        'strikes' and 'pdf_values' are read-only NumPy arrays; use to_json()
+        for a serialized form.
+        """
         return {
             'id': self.id,
             'timestamp': self.timestamp.isoformat(),
@@ -110,8 +236,8 @@ class PDFSnapshot(Base):
             'days_to_expiry': self.days_to_expiry,
             'expiration_date': self.expiration_date.isoformat(),
             'risk_free_rate': self.risk_free_rate,
-            'strikes': self.get_strikes().tolist(),
-            'pdf_values': self.get_pdf_values().tolist(),
+            'strikes': self._strikes_arr,
+            'pdf_values': self._pdf_arr,
             'sabr_params': {
                 'alpha': self.sabr_alpha,
                 'rho': self.sabr_rho,
@@ -125,6 +251,23 @@ class PDFSnapshot(Base):
             'model_used': self.model_used,
         }
 
+    def to_json(self) -> bytes:
+        """
+        Serialize snapshot to JSON.
+
+        With orjson installed the arrays are encoded straight from their
+        buffers; otherwise they go through tolist() and the json module.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        data = self.to_dict()
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        data['strikes'] = data['strikes'].tolist()
+        data['pdf_values'] = data['pdf_values'].tolist()
+        return json.dumps(data).encode('utf-8')
+
 
 class Prediction(Base):
     """
@@ -270,6 +413,28 @@ class PatternMatch(Base):
         }
 
 
+class FREDRateCache(Base):
+    """
+    Persistent cache of FRED rate lookups.
+
+    Treasury yields update at most daily, so a rate fetched today is still
+    valid after a restart; rows are keyed by the date they were fetched.
+    """
+    __tablename__ = 'fred_cache'
+
+    # Lookup key: series, lookback window and fetch date (YYYY-MM-DD)
+    series_id = Column(String(20), primary_key=True)
+    days = Column(Integer, primary_key=True)
+    as_of = Column(String(10), primary_key=True)
+
+    # Rate as decimal
+    rate = Column(Float, nullable=False)
+    fetched_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<FREDRateCache(series={self.series_id}, days={self.days}, as_of={self.as_of}, rate={self.rate:.4f})>"
+
+
 if __name__ == "__main__":
     # Print schema for documentation
     print("=" * 80)
@@ -297,4 +462,11 @@ if __name__ == "__main__":
     for column in PatternMatch.__table__.columns:
         print(f"  - {column.name}: {column.type} {'(PK)' if column.primary_key else ''}")
 
+    print("\n\nTABLE: fred_cache")
+    print("-" * 80)
+    print("Caches FRED risk-free rates per day across restarts")
+    print("\nColumns:")
+    for column in FREDRateCache.__table__.columns:
+        print(f"  - {column.name}: {column.type} {'(PK)' if column.primary_key else ''}")
+
     print("\n" + "=" * 80)
@@ -167,16 +167,14 @@ class PDFArchive:
             List of PDFSnapshot objects
         """
         with db_session() as session:
+            # One statement served by idx_ticker_ts_dte (ticker, timestamp, DTE)
             query = session.query(PDFSnapshot).filter(
-                and_(
-                    PDFSnapshot.ticker == ticker,
-                    PDFSnapshot.timestamp >= start_date,
-                    PDFSnapshot.timestamp <= end_date
-                )
+                PDFSnapshot.ticker == ticker,
+                PDFSnapshot.timestamp.between(start_date, end_date)
             )
 
             if days_to_expiry is not None:
-                query = query.filter_by(days_to_expiry=days_to_expiry)
+                query = query.filter(PDFSnapshot.days_to_expiry == days_to_expiry)
 
             snapshots = query.order_by(PDFSnapshot.timestamp).all()
             return snapshots
@@ -187,7 +185,8 @@ class PDFArchive:
         exclude_recent_days: int = 7,
         min_snapshots: int = 10,
         max_snapshots: int = 100,
-        days_to_expiry_range: Tuple[int, int] = (20, 40)
+        days_to_expiry_range: Tuple[int, int] = (20, 40),
+        implied_move_range: Tuple[float, float] = None
     ) -> List[Dict[str, Any]]:
         """
         Get historical snapshots suitable for pattern matching.
@@ -198,6 +197,8 @@ class PDFArchive:
             min_snapshots: Minimum number of snapshots to return
             max_snapshots: Maximum number of snapshots to return
             days_to_expiry_range: (min_dte, max_dte) to filter by
+            implied_move_range: (min, max) implied move in percent to filter
+                by (optional; snapshots without one are excluded)
 
         Returns:
             List of dictionaries with snapshot data for pattern matching
@@ -212,8 +213,14 @@ class PDFArchive:
                     PDFSnapshot.days_to_expiry >= days_to_expiry_range[0],
                     PDFSnapshot.days_to_expiry <= days_to_expiry_range[1]
                 )
-            ).order_by(desc(PDFSnapshot.timestamp)).limit(max_snapshots)
+            )
+
+            if implied_move_range is not None:
+                query = query.filter(
+                    PDFSnapshot.implied_move_pct_stat.between(*implied_move_range)
+                )
 
+            query = query.order_by(desc(PDFSnapshot.timestamp)).limit(max_snapshots)
             snapshots = query.all()
 
             # Convert to format expected by pattern matcher